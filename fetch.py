@@ -40,8 +40,12 @@ def main():
                         help="Backend to use (default: zendriver)")
     parser.add_argument("--headless", action="store_true", help="Run headless")
     parser.add_argument("--timeout", type=int, default=30, help="Timeout seconds")
-    parser.add_argument("--wait", type=float, default=2.0, help="JS wait seconds")
+    parser.add_argument("--wait", type=float, default=2.0, help="Max JS wait seconds")
     parser.add_argument("--max-length", type=int, default=50000, help="Max content length")
+    parser.add_argument("--no-block-resources", dest="block_resources", action="store_false",
+                        help="Load images, fonts, media and stylesheets")
+    parser.add_argument("--prewarm", action="store_true",
+                        help="zendriver: start Chrome while the plain HTTP attempt runs")
 
     args = parser.parse_args()
 
@@ -49,11 +53,15 @@ def main():
 
     # Zendriver uses fetch_page_sync, selenium uses fetch_page
     if args.backend == "zendriver":
+        if args.prewarm:
+            # Overlap Chrome start-up with the HTTP fast path; wasted if that succeeds
+            backend.prewarm_browser(headless=args.headless)
         result = backend.fetch_page_sync(
             url=args.url,
             headless=args.headless,
             timeout=args.timeout,
             wait=args.wait,
+            block_resources=args.block_resources,
         )
         # Apply truncation
         if result.get("content"):
@@ -66,6 +74,7 @@ def main():
             timeout=args.timeout,
             wait=args.wait,
             max_content_length=args.max_length,
+            block_resources=args.block_resources,
         )
 
     print(json.dumps(result, indent=2))
@@ -1,11 +1,12 @@
 """Selenium fallback skill library."""
 
 from .driver import create_driver, get_default_chrome_profile
-from .converter import extract_main_content, html_to_markdown
+from .converter import extract_main_content, extract_main_element, html_to_markdown
 
 __all__ = [
     "create_driver",
     "get_default_chrome_profile",
     "extract_main_content",
+    "extract_main_element",
     "html_to_markdown",
 ]
@@ -1,11 +1,30 @@
 """HTML content extraction and markdown conversion."""
 
 import re
-from typing import Optional
+from typing import Optional, Union
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, Comment, Tag
 
+# Prefer the C-backed lxml parser; fall back to the pure-Python one
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# selectolax (lexbor) is much faster than bs4 for the pruning pass
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+try:
+    from markdownify import MarkdownConverter
+    HAS_MARKDOWNIFY = True
+except ImportError:
+    HAS_MARKDOWNIFY = False
 
 # Elements to remove (navigation, ads, etc.)
 REMOVE_TAGS = [
@@ -18,6 +37,17 @@ REMOVE_PATTERNS = [
     r"nav", r"menu", r"sidebar", r"footer", r"header", r"cookie",
     r"banner", r"advertisement", r"social", r"comment", r"related",
 ]
+_REMOVE_ID_CLASS_RE = re.compile("|".join(REMOVE_PATTERNS), re.I)
+
+# Markdown whitespace cleanup
+_TRAILING_WS_RE = re.compile(r"[^\S\n]+(?=\n|$)")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# Candidate main content containers, in order of preference
+MAIN_SELECTORS = [
+    "main", "article", "[role=main]", "#content", "#main", "#main-content",
+    ".content", ".post", ".article",
+]
 
 
 def extract_main_content(html: str) -> str:
@@ -26,20 +56,75 @@ def extract_main_content(html: str) -> str:
 
     Tries semantic elements first, then falls back to heuristics.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    if HAS_SELECTOLAX:
+        return _extract_main_content_lexbor(html)
+    return str(_extract_main_element_bs4(html))
+
+
+def extract_main_element(html: str) -> Tag:
+    """
+    Extract the main content area from HTML as a parsed element.
+
+    Same selection as extract_main_content, but the result can be handed
+    straight to html_to_markdown without serializing and re-parsing it.
+    """
+    if HAS_SELECTOLAX:
+        return BeautifulSoup(_extract_main_content_lexbor(html), HTML_PARSER)
+    return _extract_main_element_bs4(html)
+
+
+def _extract_main_content_lexbor(html: str) -> str:
+    """Extract main content using selectolax's lexbor parser."""
+    tree = LexborHTMLParser(html)
 
     # Remove unwanted elements
-    for tag_name in REMOVE_TAGS:
-        for tag in soup.find_all(tag_name):
-            tag.decompose()
+    tree.strip_tags(REMOVE_TAGS, recursive=True)
 
     # Remove elements with nav/menu/sidebar-like IDs or classes
-    for pattern in REMOVE_PATTERNS:
-        regex = re.compile(pattern, re.I)
-        for tag in soup.find_all(id=regex):
-            tag.decompose()
-        for tag in soup.find_all(class_=regex):
-            tag.decompose()
+    for node in tree.css("[id],[class]"):
+        attrs = node.attributes
+        if (_REMOVE_ID_CLASS_RE.search(attrs.get("id") or "")
+                or _REMOVE_ID_CLASS_RE.search(attrs.get("class") or "")):
+            node.decompose()
+
+    # Try to find main content container, falling back to body
+    main = None
+    for selector in MAIN_SELECTORS:
+        main = tree.css_first(selector)
+        if main is not None:
+            break
+    else:
+        main = tree.body
+
+    if main is None:
+        return tree.html or ""
+
+    # Comments are never converted; drop them so they aren't serialized
+    # and parsed again by BeautifulSoup
+    for node in [n for n in main.traverse(include_text=True) if n.is_comment_node]:
+        node.decompose()
+
+    return main.html
+
+
+def _is_non_content(tag: Tag) -> bool:
+    """Check whether a tag's id or any of its classes marks it as non-content."""
+    if _REMOVE_ID_CLASS_RE.search(tag.get("id") or ""):
+        return True
+    return any(_REMOVE_ID_CLASS_RE.search(cls) for cls in tag.get("class") or ())
+
+
+def _extract_main_element_bs4(html: str) -> Tag:
+    """Extract main content using BeautifulSoup."""
+    soup = BeautifulSoup(html, HTML_PARSER)
+
+    # Remove unwanted elements
+    for tag in soup.find_all(REMOVE_TAGS):
+        tag.decompose()
+
+    # Remove elements with nav/menu/sidebar-like IDs or classes
+    for tag in soup.find_all(_is_non_content):
+        tag.decompose()
 
     # Try to find main content container
     main = (
@@ -54,26 +139,29 @@ def extract_main_content(html: str) -> str:
         or soup.find(class_="article")
     )
 
-    if main:
-        return str(main)
+    # Fallback: body or full soup
+    main = main or soup.find("body") or soup
 
-    # Fallback: return body or full soup
-    body = soup.find("body")
-    return str(body) if body else str(soup)
+    # Drop comments, matching the lexbor path
+    for comment in main.find_all(string=lambda text: isinstance(text, Comment)):
+        comment.extract()
 
+    return main
 
-def html_to_markdown(html: str, base_url: Optional[str] = None) -> str:
+
+def html_to_markdown(html: Union[str, Tag], base_url: Optional[str] = None) -> str:
     """
     Convert HTML to clean markdown.
 
     Args:
-        html: HTML content to convert.
+        html: HTML content to convert, or an already parsed element
+              (modified in place when base_url is given).
         base_url: Base URL for resolving relative links.
 
     Returns:
         Markdown string.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = html if isinstance(html, Tag) else BeautifulSoup(html, HTML_PARSER)
 
     # Resolve relative URLs if base_url provided
     if base_url:
@@ -83,29 +171,17 @@ def html_to_markdown(html: str, base_url: Optional[str] = None) -> str:
             tag["src"] = urljoin(base_url, tag["src"])
 
     # Use markdownify if available, otherwise simple conversion
-    try:
-        from markdownify import markdownify as md
-        markdown = md(str(soup), heading_style="ATX", strip=["img"])
-    except ImportError:
+    if HAS_MARKDOWNIFY:
+        # Convert the tree directly; markdownify() would serialize and re-parse it
+        markdown = MarkdownConverter(heading_style="ATX", strip=["img"]).convert_soup(soup)
+    else:
         markdown = _simple_html_to_markdown(soup)
 
-    # Clean up whitespace
-    lines = markdown.split("\n")
-    cleaned = []
-    prev_empty = False
-
-    for line in lines:
-        line = line.rstrip()
-        is_empty = not line.strip()
-
-        # Skip consecutive empty lines
-        if is_empty and prev_empty:
-            continue
-
-        cleaned.append(line)
-        prev_empty = is_empty
+    # Clean up whitespace: strip trailing spaces, collapse consecutive empty lines
+    markdown = _TRAILING_WS_RE.sub("", markdown)
+    markdown = _BLANK_LINES_RE.sub("\n\n", markdown)
 
-    return "\n".join(cleaned).strip()
+    return markdown.strip()
 
 
 def _simple_html_to_markdown(soup: BeautifulSoup) -> str:
@@ -153,22 +229,23 @@ def truncate_content(content: str, max_length: int = 50000) -> str:
     if len(content) <= max_length:
         return content
 
-    # Find a good breakpoint
+    # Find a good breakpoint, only looking at the last 20% of the kept text
     truncated = content[:max_length]
+    window_start = int(max_length * 0.8) + 1
 
     # Try to break at paragraph
-    last_para = truncated.rfind("\n\n")
-    if last_para > max_length * 0.8:
+    last_para = truncated.rfind("\n\n", window_start)
+    if last_para != -1:
         truncated = truncated[:last_para]
     else:
         # Break at sentence
         last_sentence = max(
-            truncated.rfind(". "),
-            truncated.rfind(".\n"),
-            truncated.rfind("? "),
-            truncated.rfind("! "),
+            truncated.rfind(". ", window_start),
+            truncated.rfind(".\n", window_start),
+            truncated.rfind("? ", window_start),
+            truncated.rfind("! ", window_start),
         )
-        if last_sentence > max_length * 0.8:
+        if last_sentence != -1:
             truncated = truncated[:last_sentence + 1]
 
     return truncated + "\n\n[Content truncated...]"
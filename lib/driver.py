@@ -1,6 +1,7 @@
 """Chrome WebDriver management."""
 
 import platform
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -15,6 +16,30 @@ try:
 except ImportError:
     HAS_UNDETECTED = False
 
+# Subresources skipped by default when fetching; none of them affect the
+# extracted content. Used by both backends via CDP Network.setBlockedURLs.
+# Each extension is matched with and without a query string (style.css?v=3).
+_BLOCKED_EXTENSIONS = [
+    "png", "jpg", "jpeg", "webp", "gif", "svg", "ico",
+    "woff", "woff2", "ttf", "otf",
+    "mp4", "webm", "mp3",
+    "css",
+]
+BLOCKED_URL_PATTERNS = [
+    pattern for ext in _BLOCKED_EXTENSIONS for pattern in (f"*.{ext}", f"*.{ext}?*")
+]
+
+# Flags that cut background work and startup cost without affecting the DOM
+LIGHTWEIGHT_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-software-rasterizer",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--mute-audio",
+]
+
 
 def get_default_chrome_profile() -> Path:
     """Get the default Chrome user data directory for the current OS."""
@@ -31,12 +56,24 @@ def get_default_chrome_profile() -> Path:
     raise RuntimeError(f"Unsupported platform: {system}")
 
 
+@lru_cache(maxsize=1)
+def _chromedriver_path() -> Optional[str]:
+    """Install ChromeDriver via webdriver-manager once per process, if available."""
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+    except ImportError:
+        return None
+    return ChromeDriverManager().install()
+
+
 def create_driver(
     profile_path: Optional[str] = None,
     headless: bool = False,
     timeout: int = 30,
     use_profile: bool = True,
     use_undetected: bool = True,
+    block_resources: bool = True,
+    render: bool = False,
 ) -> webdriver.Chrome:
     """
     Create a Chrome WebDriver instance.
@@ -48,6 +85,13 @@ def create_driver(
         use_profile: Whether to use existing Chrome profile. If headless=True and
                      profile is locked (Chrome running), this is auto-disabled.
         use_undetected: Use undetected-chromedriver to bypass bot detection.
+        block_resources: Skip requests matching BLOCKED_URL_PATTERNS (images,
+                         fonts, media and stylesheets). Disable for pages
+                         that need a fully rendered DOM.
+        render: Use Chrome's new headless mode. By default the standard
+                driver runs plain --headless, which is enough for DOM and
+                text extraction. undetected-chromedriver always uses new
+                headless mode.
 
     Returns:
         Configured Chrome WebDriver instance.
@@ -64,6 +108,7 @@ def create_driver(
                 headless=headless,
                 timeout=timeout,
                 use_profile=use_profile,
+                block_resources=block_resources,
             )
         except Exception as e:
             # If undetected fails (e.g., profile locked), try standard driver
@@ -74,6 +119,8 @@ def create_driver(
                     headless=headless,
                     timeout=timeout,
                     use_profile=False,  # Skip profile to avoid lock
+                    block_resources=block_resources,
+                    render=render,
                 )
             raise
 
@@ -83,18 +130,42 @@ def create_driver(
         headless=headless,
         timeout=timeout,
         use_profile=use_profile,
+        block_resources=block_resources,
+        render=render,
     )
 
 
+def _add_performance_args(options: Options, user_data_dir: Optional[str]) -> None:
+    """Add flags that trim Chrome work we don't need for content extraction."""
+    for arg in LIGHTWEIGHT_ARGS:
+        options.add_argument(arg)
+
+    # The user's own profile may rely on extensions (SSO, etc.); keep them there
+    if not user_data_dir:
+        options.add_argument("--disable-extensions")
+
+
+def _block_resources(driver: webdriver.Chrome) -> None:
+    """Stop Chrome from requesting images, fonts, media and stylesheets."""
+    # Applied over CDP rather than as profile prefs, so the user's own
+    # profile is never modified
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
+
 def _create_undetected_driver(
     profile_path: Optional[str],
     headless: bool,
     timeout: int,
     use_profile: bool,
+    block_resources: bool,
 ) -> webdriver.Chrome:
     """Create driver using undetected-chromedriver."""
     options = uc.ChromeOptions()
 
+    # Return from driver.get() at DOMContentLoaded; callers wait for what they need
+    options.page_load_strategy = "eager"
+
     # Anti-detection: Set realistic window size (headless often has weird sizes)
     options.add_argument("--window-size=1920,1080")
 
@@ -127,9 +198,7 @@ def _create_undetected_driver(
                 pass
 
     # Performance settings
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
+    _add_performance_args(options, user_data_dir)
 
     driver = uc.Chrome(
         options=options,
@@ -147,6 +216,8 @@ def _create_undetected_driver(
             window.chrome = {runtime: {}};
         """
     })
+    if block_resources:
+        _block_resources(driver)
 
     return driver
 
@@ -156,46 +227,52 @@ def _create_standard_driver(
     headless: bool,
     timeout: int,
     use_profile: bool,
+    block_resources: bool,
+    render: bool,
 ) -> webdriver.Chrome:
     """Create driver using standard Selenium."""
     options = Options()
 
+    # Return from driver.get() at DOMContentLoaded; callers wait for what they need
+    options.page_load_strategy = "eager"
+
     if headless:
-        options.add_argument("--headless=new")
+        options.add_argument("--headless=new" if render else "--headless")
 
     # In headless mode, don't use existing profile by default (avoids lock issues)
     should_use_profile = use_profile and (not headless or profile_path)
 
+    user_data_dir = None
     if should_use_profile:
         if profile_path and profile_path != "auto":
-            options.add_argument(f"--user-data-dir={profile_path}")
+            user_data_dir = profile_path
         elif not headless:
             try:
                 default_profile = get_default_chrome_profile()
                 if default_profile.exists():
-                    options.add_argument(f"--user-data-dir={default_profile}")
+                    user_data_dir = str(default_profile)
             except RuntimeError:
                 pass
 
+    if user_data_dir:
+        options.add_argument(f"--user-data-dir={user_data_dir}")
+
     # Reduce detection
     options.add_argument("--disable-blink-features=AutomationControlled")
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option("useAutomationExtension", False)
 
     # Performance/stability settings
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
+    _add_performance_args(options, user_data_dir)
     options.add_argument("--remote-debugging-port=0")
 
     # Try to use webdriver-manager for auto ChromeDriver management
-    try:
-        from webdriver_manager.chrome import ChromeDriverManager
-        service = Service(ChromeDriverManager().install())
-    except ImportError:
-        service = Service()
+    driver_path = _chromedriver_path()
+    service = Service(driver_path) if driver_path else Service()
 
     driver = webdriver.Chrome(service=service, options=options)
     driver.set_page_load_timeout(timeout)
+    if block_resources:
+        _block_resources(driver)
 
     return driver
@@ -0,0 +1,108 @@
+"""Shared Chrome WebDriver reused across Selenium backend calls."""
+
+import atexit
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Tuple
+
+from selenium import webdriver
+
+from .driver import create_driver
+
+# Seconds a borrower on another thread waits for the driver before giving up
+BORROW_TIMEOUT = 120
+
+_driver: Optional[webdriver.Chrome] = None
+_driver_key: Optional[Tuple[bool, bool]] = None
+_driver_timeout: Optional[int] = None
+_lock = threading.Lock()
+_owner: Optional[int] = None
+
+
+@contextmanager
+def borrow_driver(
+    headless: bool = False,
+    timeout: int = 30,
+    block_resources: bool = False,
+    factory: Callable[..., webdriver.Chrome] = create_driver,
+) -> Iterator[webdriver.Chrome]:
+    """
+    Borrow the shared WebDriver, starting Chrome on first use.
+
+    Only one driver is kept alive, and only one caller can hold it at a
+    time. Borrows are not reentrant: borrowing again from the thread that
+    holds the driver raises RuntimeError instead of deadlocking, and other
+    threads wait up to BORROW_TIMEOUT seconds before RuntimeError is raised.
+
+    A different headless or block_resources setting quits the current
+    driver and starts a replacement; a different timeout is applied to the
+    running one. If the caller raises, the driver is quit so a broken
+    session is never handed out again.
+
+    Args:
+        headless: Run in headless mode (no visible window).
+        timeout: Page load timeout in seconds.
+        block_resources: Skip images, fonts, media and stylesheets.
+        factory: Callable used to start a new driver.
+
+    Yields:
+        Chrome WebDriver instance, reset to about:blank when returned.
+    """
+    global _driver, _driver_key, _driver_timeout, _owner
+
+    if _owner == threading.get_ident():
+        raise RuntimeError("The shared WebDriver is already borrowed by this thread")
+    if not _lock.acquire(timeout=BORROW_TIMEOUT):
+        raise RuntimeError(f"Timed out after {BORROW_TIMEOUT}s waiting for the shared WebDriver")
+    _owner = threading.get_ident()
+
+    try:
+        key = (headless, block_resources)
+        if _driver is not None and _driver_key != key:
+            _quit_driver()
+
+        if _driver is None:
+            _driver = factory(headless=headless, timeout=timeout, block_resources=block_resources)
+            _driver_key = key
+            _driver_timeout = timeout
+        elif _driver_timeout != timeout:
+            _driver.set_page_load_timeout(timeout)
+            _driver_timeout = timeout
+
+        try:
+            yield _driver
+        except BaseException:
+            _quit_driver()
+            raise
+
+        # Leave the page so the next borrower starts from a blank tab
+        try:
+            _driver.get("about:blank")
+        except Exception:
+            _quit_driver()
+    finally:
+        _owner = None
+        _lock.release()
+
+
+def close_driver() -> None:
+    """Quit the shared WebDriver, if one is running."""
+    with _lock:
+        _quit_driver()
+
+
+def _quit_driver() -> None:
+    """Quit and forget the shared driver. Caller must hold the lock."""
+    global _driver, _driver_key, _driver_timeout
+
+    if _driver is not None:
+        try:
+            _driver.quit()
+        except Exception:
+            pass
+    _driver = None
+    _driver_key = None
+    _driver_timeout = None
+
+
+atexit.register(close_driver)
@@ -1,10 +1,179 @@
 """Selenium backend for browser automation using undetected-chromedriver."""
 
 import time
-from typing import Any
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+from urllib.parse import quote_plus
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 
 from .driver import create_driver
-from .converter import extract_main_content, html_to_markdown, truncate_content
+from .pool import borrow_driver
+from .converter import extract_main_element, html_to_markdown, truncate_content
+
+# Seconds between DOM size checks while waiting for a page to settle
+DOM_POLL_INTERVAL = 0.2
+
+# Resolves true as soon as arguments[0] matches, or false after arguments[1] ms
+_WAIT_FOR_SELECTOR_JS = """
+    const [selector, timeoutMs, done] = arguments;
+    if (document.querySelector(selector)) return done(true);
+
+    const observer = new MutationObserver(() => {
+        if (document.querySelector(selector)) {
+            observer.disconnect();
+            clearTimeout(timer);
+            done(true);
+        }
+    });
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        done(false);
+    }, timeoutMs);
+    observer.observe(document, { childList: true, subtree: true });
+"""
+
+# Result parsers run in the page; arguments[0] is the maximum result count.
+# Each returns a list of {title, url, snippet} in one WebDriver round-trip.
+_GOOGLE_RESULTS_JS = """
+    const max = arguments[0];
+    const results = [];
+    const h3s = Array.from(document.getElementsByTagName('h3')).slice(0, max * 2);
+
+    for (const h3 of h3s) {
+        const title = h3.innerText.trim();
+        if (!title) continue;
+
+        const link = h3.closest('a') || h3.parentElement?.querySelector('a');
+        const url = link?.href;
+        if (!url || url.includes('google.com')) continue;
+
+        let snippet = '';
+        const container = h3.closest('div[data-hveid]') || h3.closest('div.g');
+        if (container) {
+            for (const selector of ['div[data-sncf]', 'div.VwiC3b', 'span.aCOpRe', 'div > span']) {
+                const el = container.querySelector(selector);
+                if (!el) continue;
+                snippet = el.innerText.trim();
+                if (snippet.length > 20) break;
+            }
+        }
+
+        results.push({ title, url, snippet });
+        if (results.length >= max) break;
+    }
+
+    return results;
+"""
+
+_BING_RESULTS_JS = """
+    const max = arguments[0];
+    const results = [];
+    const items = Array.from(document.getElementsByClassName('b_algo')).slice(0, max);
+
+    for (const item of items) {
+        const titleEl = item.querySelector('h2 a');
+        if (!titleEl) continue;
+
+        const title = titleEl.innerText.trim();
+        const url = titleEl.href;
+        if (!title || !url) continue;
+
+        const snippetEl = item.querySelector('p');
+        const snippet = snippetEl ? snippetEl.innerText.trim() : '';
+
+        results.push({ title, url, snippet });
+    }
+
+    return results;
+"""
+
+_DUCKDUCKGO_RESULTS_JS = """
+    const max = arguments[0];
+    const results = [];
+    const articles = Array.from(document.getElementsByTagName('article')).slice(0, max);
+
+    for (const article of articles) {
+        const titleEl = article.querySelector('h2');
+        const linkEl = article.querySelector('a');
+        if (!titleEl || !linkEl) continue;
+
+        const title = titleEl.innerText.trim();
+        const url = linkEl.href;
+        if (!title || !url) continue;
+
+        const snippetEl = article.querySelector("div[data-result='snippet']");
+        const snippet = snippetEl ? snippetEl.innerText.trim() : '';
+
+        results.push({ title, url, snippet });
+    }
+
+    return results;
+"""
+
+
+@contextmanager
+def _session(
+    driver: Optional[webdriver.Chrome],
+    headless: bool,
+    timeout: int,
+    block_resources: bool = False,
+) -> Iterator[webdriver.Chrome]:
+    """Yield the caller's driver, or borrow the shared one."""
+    if driver is not None:
+        yield driver
+        return
+
+    with borrow_driver(
+        headless=headless,
+        timeout=timeout,
+        block_resources=block_resources,
+        factory=create_driver,
+    ) as shared:
+        yield shared
+
+
+def _wait_for_page(driver: webdriver.Chrome, wait: float) -> None:
+    """
+    Wait until the document is parsed and its DOM has stopped growing.
+
+    This doesn't wait for the load event, so slow subresources don't hold
+    up the fetch. The DOM is considered settled once the element count is
+    unchanged across two polls; `wait` caps the whole wait. A navigation
+    mid-poll ends the wait early rather than failing the fetch.
+    """
+    deadline = time.monotonic() + wait
+    try:
+        while driver.execute_script("return document.readyState") == "loading":
+            if time.monotonic() >= deadline:
+                return
+            time.sleep(DOM_POLL_INTERVAL)
+
+        last_count = None
+        while time.monotonic() < deadline:
+            count = driver.execute_script("return document.getElementsByTagName('*').length")
+            if count == last_count:
+                break
+            last_count = count
+            time.sleep(DOM_POLL_INTERVAL)
+    except WebDriverException:
+        return
+
+
+def _wait_for_selector(driver: webdriver.Chrome, selector: str, timeout: float = 10) -> bool:
+    """
+    Wait for an element matching selector to appear.
+
+    Uses a MutationObserver inside the page, so the wait costs one WebDriver
+    call instead of a find_elements round-trip every polling interval.
+    """
+    try:
+        return bool(driver.execute_async_script(
+            _WAIT_FOR_SELECTOR_JS, selector, int(timeout * 1000)
+        ))
+    except Exception:
+        return False
 
 
 def fetch_page(
@@ -13,6 +182,8 @@ def fetch_page(
     timeout: int = 30,
     wait: float = 2.0,
     max_content_length: int = 50000,
+    driver: Optional[webdriver.Chrome] = None,
+    block_resources: bool = True,
 ) -> dict[str, Any]:
     """
     Fetch a URL using Selenium + undetected-chromedriver.
@@ -21,8 +192,11 @@ def fetch_page(
         url: URL to fetch.
         headless: Run in headless mode.
         timeout: Page load timeout in seconds.
-        wait: Seconds to wait for JavaScript to render.
+        wait: Maximum seconds to wait for JavaScript to finish rendering.
         max_content_length: Maximum content length before truncation.
+        driver: Existing WebDriver to use. If None, the shared driver is borrowed.
+        block_resources: Skip images, fonts, media and stylesheets. Ignored
+                         when driver is given.
 
     Returns:
         Dictionary with page content and metadata.
@@ -37,43 +211,35 @@ def fetch_page(
         "error": None,
     }
 
-    driver = None
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
 
     try:
-        driver = create_driver(headless=headless, timeout=timeout)
-        driver.get(url)
-
-        if wait > 0:
-            time.sleep(wait)
-
-        result["final_url"] = driver.current_url
-        result["title"] = driver.title
-
-        html = driver.page_source
-        main_content = extract_main_content(html)
-        markdown = html_to_markdown(main_content, base_url=result["final_url"])
-        markdown = truncate_content(markdown, max_content_length)
-
-        result["content"] = markdown
-        result["success"] = True
-        result["metadata"] = {
-            "fetch_time_ms": int((time.time() - start_time) * 1000),
-            "content_length": len(markdown),
-            "html_length": len(html),
-            "backend": "selenium",
-        }
+        with _session(driver, headless, timeout, block_resources) as driver:
+            driver.get(url)
+
+            if wait > 0:
+                _wait_for_page(driver, wait)
+
+            result["final_url"] = driver.current_url
+            result["title"] = driver.title
+
+            html = driver.page_source
+            main_content = extract_main_element(html)
+            markdown = html_to_markdown(main_content, base_url=result["final_url"])
+            markdown = truncate_content(markdown, max_content_length)
+
+            result["content"] = markdown
+            result["success"] = True
+            result["metadata"] = {
+                "fetch_time_ms": (time.perf_counter_ns() - start_time) // 1_000_000,
+                "content_length": len(markdown),
+                "html_length": len(html),
+                "backend": "selenium",
+            }
 
     except Exception as e:
         result["error"] = f"{type(e).__name__}: {str(e)}"
-        result["metadata"]["fetch_time_ms"] = int((time.time() - start_time) * 1000)
-
-    finally:
-        if driver:
-            try:
-                driver.quit()
-            except Exception:
-                pass
+        result["metadata"]["fetch_time_ms"] = (time.perf_counter_ns() - start_time) // 1_000_000
 
     return result
 
@@ -83,13 +249,9 @@ def search_google(
     max_results: int = 10,
     headless: bool = False,
     timeout: int = 30,
+    driver: Optional[webdriver.Chrome] = None,
 ) -> dict[str, Any]:
     """Perform Google search using Selenium."""
-    from urllib.parse import quote_plus
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-
     result = {
         "success": False,
         "query": query,
@@ -99,88 +261,36 @@ def search_google(
         "error": None,
     }
 
-    driver = None
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     search_url = f"https://www.google.com/search?q={quote_plus(query)}"
 
     try:
-        driver = create_driver(headless=headless, timeout=timeout)
-        driver.get(search_url)
-
-        # Wait for results
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "h3"))
-            )
-            time.sleep(1)
-        except Exception:
-            pass
-
-        # Parse results
-        results = []
-        h3_elements = driver.find_elements(By.CSS_SELECTOR, "h3")
-
-        for h3 in h3_elements[:max_results * 2]:
-            try:
-                title = h3.text.strip()
-                if not title:
-                    continue
-
-                try:
-                    link_elem = h3.find_element(By.XPATH, "./ancestor::a")
-                    url = link_elem.get_attribute("href")
-                except Exception:
-                    try:
-                        parent = h3.find_element(By.XPATH, "./..")
-                        link_elem = parent.find_element(By.CSS_SELECTOR, "a")
-                        url = link_elem.get_attribute("href")
-                    except Exception:
-                        continue
-
-                if not url or "google.com" in url:
-                    continue
-
-                snippet = ""
-                try:
-                    container = h3.find_element(By.XPATH, "./ancestor::div[contains(@class, 'g') or contains(@data-hveid, '')]")
-                    for selector in ["div[data-sncf]", "div.VwiC3b", "span.aCOpRe", "div > span"]:
-                        try:
-                            snippet_elem = container.find_element(By.CSS_SELECTOR, selector)
-                            snippet = snippet_elem.text.strip()
-                            if snippet and len(snippet) > 20:
-                                break
-                        except Exception:
-                            continue
-                except Exception:
-                    pass
-
-                results.append({"title": title, "url": url, "snippet": snippet})
-                if len(results) >= max_results:
-                    break
-            except Exception:
-                continue
-
-        result["results"] = results
-        result["success"] = len(results) > 0
-        result["metadata"] = {
-            "search_time_ms": int((time.time() - start_time) * 1000),
-            "result_count": len(results),
-            "backend": "selenium",
-        }
+        with _session(driver, headless, timeout) as driver:
+            driver.get(search_url)
+
+            # Wait for results
+            if _wait_for_selector(driver, "h3"):
+                time.sleep(1)
 
-        if not results:
-            result["error"] = "No results found"
+            # Parse results in a single script call
+            results = driver.execute_script(_GOOGLE_RESULTS_JS, max_results)
+            if not isinstance(results, list):
+                results = []
+
+            result["results"] = results
+            result["success"] = len(results) > 0
+            result["metadata"] = {
+                "search_time_ms": (time.perf_counter_ns() - start_time) // 1_000_000,
+                "result_count": len(results),
+                "backend": "selenium",
+            }
+
+            if not results:
+                result["error"] = "No results found"
 
     except Exception as e:
         result["error"] = f"{type(e).__name__}: {str(e)}"
-        result["metadata"]["search_time_ms"] = int((time.time() - start_time) * 1000)
-
-    finally:
-        if driver:
-            try:
-                driver.quit()
-            except Exception:
-                pass
+        result["metadata"]["search_time_ms"] = (time.perf_counter_ns() - start_time) // 1_000_000
 
     return result
 
@@ -190,13 +300,9 @@ def search_bing(
     max_results: int = 10,
     headless: bool = False,
     timeout: int = 30,
+    driver: Optional[webdriver.Chrome] = None,
 ) -> dict[str, Any]:
     """Perform Bing search using Selenium."""
-    from urllib.parse import quote_plus
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-
     result = {
         "success": False,
         "query": query,
@@ -206,63 +312,34 @@ def search_bing(
         "error": None,
     }
 
-    driver = None
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     search_url = f"https://www.bing.com/search?q={quote_plus(query)}"
 
     try:
-        driver = create_driver(headless=headless, timeout=timeout)
-        driver.get(search_url)
-
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "li.b_algo"))
-            )
-        except Exception:
-            pass
-
-        results = []
-        elements = driver.find_elements(By.CSS_SELECTOR, "li.b_algo")
-
-        for elem in elements[:max_results]:
-            try:
-                title_elem = elem.find_element(By.CSS_SELECTOR, "h2 a")
-                title = title_elem.text.strip()
-                url = title_elem.get_attribute("href")
-
-                snippet = ""
-                try:
-                    snippet_elem = elem.find_element(By.CSS_SELECTOR, "p")
-                    snippet = snippet_elem.text.strip()
-                except Exception:
-                    pass
-
-                if title and url:
-                    results.append({"title": title, "url": url, "snippet": snippet})
-            except Exception:
-                continue
-
-        result["results"] = results
-        result["success"] = len(results) > 0
-        result["metadata"] = {
-            "search_time_ms": int((time.time() - start_time) * 1000),
-            "result_count": len(results),
-            "backend": "selenium",
-        }
+        with _session(driver, headless, timeout) as driver:
+            driver.get(search_url)
+
+            _wait_for_selector(driver, "li.b_algo")
+
+            # Parse results in a single script call
+            results = driver.execute_script(_BING_RESULTS_JS, max_results)
+            if not isinstance(results, list):
+                results = []
 
-        if not results:
-            result["error"] = "No results found"
+            result["results"] = results
+            result["success"] = len(results) > 0
+            result["metadata"] = {
+                "search_time_ms": (time.perf_counter_ns() - start_time) // 1_000_000,
+                "result_count": len(results),
+                "backend": "selenium",
+            }
+
+            if not results:
+                result["error"] = "No results found"
 
     except Exception as e:
         result["error"] = f"{type(e).__name__}: {str(e)}"
-        result["metadata"]["search_time_ms"] = int((time.time() - start_time) * 1000)
-
-    finally:
-        if driver:
-            try:
-                driver.quit()
-            except Exception:
-                pass
+        result["metadata"]["search_time_ms"] = (time.perf_counter_ns() - start_time) // 1_000_000
 
     return result
 
@@ -272,13 +349,9 @@ def search_duckduckgo(
     max_results: int = 10,
     headless: bool = False,
     timeout: int = 30,
+    driver: Optional[webdriver.Chrome] = None,
 ) -> dict[str, Any]:
     """Perform DuckDuckGo search using Selenium."""
-    from urllib.parse import quote_plus
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-
     result = {
         "success": False,
         "query": query,
@@ -288,65 +361,34 @@ def search_duckduckgo(
         "error": None,
     }
 
-    driver = None
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     search_url = f"https://duckduckgo.com/?q={quote_plus(query)}"
 
     try:
-        driver = create_driver(headless=headless, timeout=timeout)
-        driver.get(search_url)
-
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "article"))
-            )
-            time.sleep(1)
-        except Exception:
-            pass
-
-        results = []
-        elements = driver.find_elements(By.CSS_SELECTOR, "article")
-
-        for elem in elements[:max_results]:
-            try:
-                title_elem = elem.find_element(By.CSS_SELECTOR, "h2")
-                link_elem = elem.find_element(By.CSS_SELECTOR, "a")
-
-                title = title_elem.text.strip()
-                url = link_elem.get_attribute("href")
-
-                snippet = ""
-                try:
-                    snippet_elem = elem.find_element(By.CSS_SELECTOR, "div[data-result='snippet']")
-                    snippet = snippet_elem.text.strip()
-                except Exception:
-                    pass
-
-                if title and url:
-                    results.append({"title": title, "url": url, "snippet": snippet})
-            except Exception:
-                continue
-
-        result["results"] = results
-        result["success"] = len(results) > 0
-        result["metadata"] = {
-            "search_time_ms": int((time.time() - start_time) * 1000),
-            "result_count": len(results),
-            "backend": "selenium",
-        }
+        with _session(driver, headless, timeout) as driver:
+            driver.get(search_url)
+
+            if _wait_for_selector(driver, "article"):
+                time.sleep(1)
+
+            # Parse results in a single script call
+            results = driver.execute_script(_DUCKDUCKGO_RESULTS_JS, max_results)
+            if not isinstance(results, list):
+                results = []
+
+            result["results"] = results
+            result["success"] = len(results) > 0
+            result["metadata"] = {
+                "search_time_ms": (time.perf_counter_ns() - start_time) // 1_000_000,
+                "result_count": len(results),
+                "backend": "selenium",
+            }
 
-        if not results:
-            result["error"] = "No results found"
+            if not results:
+                result["error"] = "No results found"
 
     except Exception as e:
         result["error"] = f"{type(e).__name__}: {str(e)}"
-        result["metadata"]["search_time_ms"] = int((time.time() - start_time) * 1000)
-
-    finally:
-        if driver:
-            try:
-                driver.quit()
-            except Exception:
-                pass
+        result["metadata"]["search_time_ms"] = (time.perf_counter_ns() - start_time) // 1_000_000
 
     return result
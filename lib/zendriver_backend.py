@@ -1,9 +1,297 @@
 """Zendriver backend for browser automation with superior anti-bot bypass."""
 
 import asyncio
+import atexit
+import concurrent.futures
+import copy
+import functools
+import inspect
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from html import unescape
 from typing import Optional
+from urllib.parse import quote_plus
 
 import zendriver as zd
+from zendriver import cdp
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+from .driver import BLOCKED_URL_PATTERNS
+from .converter import (
+    MAIN_SELECTORS,
+    REMOVE_PATTERNS,
+    REMOVE_TAGS,
+    extract_main_element,
+    html_to_markdown,
+)
+
+# Shared browser, reused by every call made on the same event loop
+_browser: Optional[zd.Browser] = None
+_browser_key: Optional[bool] = None
+_browser_loop: Optional[asyncio.AbstractEventLoop] = None
+_browser_lock: Optional[asyncio.Lock] = None
+
+# Event loop behind the synchronous wrappers. It runs forever in a daemon
+# thread, so the shared browser survives from one sync call to the next.
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+# Longest time close_browser waits for the browser to stop (seconds)
+BROWSER_STOP_TIMEOUT = 10
+
+# Seconds fetch_page_sync allows on top of timeout and wait, for browser
+# start-up and extraction, before giving up on the fetch
+SYNC_FETCH_MARGIN = 30
+
+# Longest time to wait for search results to appear before parsing anyway
+RESULTS_WAIT_SECONDS = 10
+
+# Polling interval bounds for _wait_for (seconds)
+POLL_INTERVAL_MIN = 0.05
+POLL_INTERVAL_MAX = 0.25
+
+# Plain HTTP fast path tried by fetch_page before starting the browser
+HTTP_TIMEOUT_SECONDS = 10
+HTTP_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
+HTTP_MIN_HTML_BYTES = 1024
+HTTP_MIN_CONTENT_CHARS = 200
+
+# Markers of a bot-challenge interstitial, looked for only in the <head> and
+# title: ordinary pages mention captchas or JavaScript in their body all the
+# time. JS-only shells are caught by HTTP_MIN_CONTENT_CHARS instead.
+_CHALLENGE_HEAD_RE = re.compile(r"cf-chl|challenge-platform", re.I)
+_CHALLENGE_TITLE_RE = re.compile(r"just a moment\.\.\.|attention required", re.I)
+_HEAD_RE = re.compile(r"<head[^>]*>(.*?)</head>", re.I | re.S)
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.I | re.S)
+
+# In-process result cache: entries kept, and seconds before an entry expires.
+# Search results go stale much sooner than page content.
+CACHE_MAXSIZE = 256
+CACHE_TTL_SECONDS = 3600
+SEARCH_CACHE_TTL_SECONDS = 300
+
+_caches: list[OrderedDict] = []
+
+# Page info plus only the main content element, chosen in the page the same
+# way the converter would choose it, so the rest of the DOM is never sent
+# over CDP. Candidates inside removed tags or non-content ids/classes are
+# skipped; the converter still prunes what is left.
+_EXTRACT_JS = """
+(() => {
+    const selectors = %s;
+    const removedTags = %s;
+    const removedPattern = new RegExp(%s, 'i');
+
+    const isRemoved = (el) => {
+        for (let node = el; node && node !== document.body; node = node.parentElement) {
+            if (node.matches(removedTags)) return true;
+            if (removedPattern.test(node.id || '')) return true;
+            if (removedPattern.test(node.getAttribute('class') || '')) return true;
+        }
+        return false;
+    };
+
+    let main = null;
+    for (const selector of selectors) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (!isRemoved(el)) {
+                main = el;
+                break;
+            }
+        }
+        if (main) break;
+    }
+    main = main || document.body || document.documentElement;
+
+    return {title: document.title, url: location.href, html: main.outerHTML};
+})()
+""" % (
+    json.dumps(MAIN_SELECTORS),
+    json.dumps(",".join(REMOVE_TAGS)),
+    json.dumps("|".join(REMOVE_PATTERNS)),
+)
+
+# Result parsers evaluated in the page. Each is a function of the maximum
+# result count and returns a list of {title, url, snippet}; see _results_js.
+_GOOGLE_RESULTS_JS = """
+(max => {
+    const results = [];
+    const seen = new Set();
+    const h3s = document.getElementsByTagName('h3');
+
+    for (const h3 of h3s) {
+        if (results.length >= max) break;
+
+        const title = h3.textContent?.trim();
+        if (!title) continue;
+
+        // Walk up once to find the enclosing link and result container
+        let link = null;
+        let container = null;
+        let fallbackContainer = null;
+        for (let node = h3; node && !(link && container); node = node.parentElement) {
+            if (!link && node.tagName === 'A') link = node;
+            if (!container && node.tagName === 'DIV' && node.hasAttribute('data-hveid')) {
+                container = node;
+            }
+            if (!fallbackContainer && node.classList.contains('g')) fallbackContainer = node;
+        }
+        container = container || fallbackContainer;
+
+        if (!link) {
+            link = h3.parentElement?.querySelector('a');
+        }
+        if (!link) continue;
+
+        const url = link.href;
+        if (!url || url.includes('google.com')) continue;
+        if (seen.has(url)) continue;
+        seen.add(url);
+
+        // Find snippet
+        let snippet = '';
+        if (container) {
+            const snippetEl = container.querySelector('div[data-sncf], div.VwiC3b, span.aCOpRe');
+            if (snippetEl) {
+                snippet = snippetEl.textContent?.trim() || '';
+            }
+        }
+
+        results.push({ title, url, snippet });
+    }
+
+    return results;
+})
+"""
+
+_BING_RESULTS_JS = """
+(max => {
+    const results = [];
+    const seen = new Set();
+    const items = document.getElementsByClassName('b_algo');
+
+    for (const item of items) {
+        if (results.length >= max) break;
+
+        const titleEl = item.querySelector('h2 a');
+        if (!titleEl) continue;
+
+        const title = titleEl.textContent?.trim();
+        const url = titleEl.href;
+
+        if (!title || !url) continue;
+        if (seen.has(url)) continue;
+        seen.add(url);
+
+        let snippet = '';
+        const snippetEl = item.querySelector('p');
+        if (snippetEl) {
+            snippet = snippetEl.textContent?.trim() || '';
+        }
+
+        results.push({ title, url, snippet });
+    }
+
+    return results;
+})
+"""
+
+
+def _results_js(parser: str, max_results: int) -> str:
+    """Build an expression that runs a result parser capped at max_results."""
+    return f"({parser})({int(max_results)})"
+
+
+def _ttl_cache(*key_params: str, ttl: Optional[float] = None):
+    """
+    Cache successful results of an async entry point in-process.
+
+    Entries are keyed by the named parameters, expire after ttl seconds
+    and are evicted least-recently-used beyond CACHE_MAXSIZE. Concurrent
+    calls on one event loop with the same key wait for the first one
+    instead of opening their own tab. Failed results are never cached.
+    Callers can pass cache=False to bypass the cache.
+
+    Args:
+        key_params: Names of the parameters that identify a result.
+        ttl: Seconds an entry stays fresh. Defaults to CACHE_TTL_SECONDS.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        entries: OrderedDict = OrderedDict()
+        # (loop, key) -> [lock, callers using it]; asyncio locks are bound to
+        # one loop, and the sync loop and a caller's loop can share a key
+        locks: dict[tuple, list] = {}
+        _caches.append(entries)
+
+        def lookup(key: tuple) -> Optional[dict]:
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= time.monotonic():
+                del entries[key]
+                return None
+            entries.move_to_end(key)
+            hit = copy.deepcopy(value)
+            hit["metadata"]["cached"] = True
+            return hit
+
+        @functools.wraps(func)
+        async def wrapper(*args, cache: bool = True, **kwargs):
+            if not cache:
+                return await func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(bound.arguments[name] for name in key_params)
+
+            hit = lookup(key)
+            if hit is not None:
+                return hit
+
+            lock_key = (asyncio.get_running_loop(), key)
+            slot = locks.setdefault(lock_key, [asyncio.Lock(), 0])
+            slot[1] += 1
+            try:
+                async with slot[0]:
+                    hit = lookup(key)
+                    if hit is not None:
+                        return hit
+
+                    value = await func(*args, **kwargs)
+                    if value.get("success"):
+                        lifetime = CACHE_TTL_SECONDS if ttl is None else ttl
+                        entries[key] = (time.monotonic() + lifetime, copy.deepcopy(value))
+                        entries.move_to_end(key)
+                        while len(entries) > CACHE_MAXSIZE:
+                            entries.popitem(last=False)
+                    return value
+            finally:
+                slot[1] -= 1
+                if not slot[1]:
+                    del locks[lock_key]
+
+        return wrapper
+
+    return decorator
+
+
+def clear_cache() -> None:
+    """Drop every cached fetch and search result."""
+    for entries in _caches:
+        entries.clear()
 
 
 async def create_browser(
@@ -27,27 +315,291 @@ async def create_browser(
     return browser
 
 
+async def get_browser(headless: bool = True) -> zd.Browser:
+    """
+    Get the shared Zendriver browser, starting it on first use.
+
+    The browser is tied to the event loop that started it; zendriver stops
+    it when that loop closes, and a call from a new loop starts a fresh one.
+    Asking for a different headless setting replaces the running browser.
+
+    Args:
+        headless: Run in headless mode (no visible window).
+
+    Returns:
+        Running Zendriver browser instance.
+    """
+    global _browser, _browser_key, _browser_loop, _browser_lock
+
+    loop = asyncio.get_running_loop()
+    if _browser_loop is not loop:
+        # A browser left on another loop that is still running (such as
+        # the sync loop) would never be stopped once forgotten
+        if _browser is not None and _browser_loop.is_running():
+            asyncio.run_coroutine_threadsafe(_browser.stop(), _browser_loop)
+        _browser = None
+        _browser_key = None
+        _browser_loop = loop
+        _browser_lock = asyncio.Lock()
+
+    async with _browser_lock:
+        if _browser is not None and (_browser.stopped or _browser_key != headless):
+            await _stop_browser()
+
+        if _browser is None:
+            _browser = await create_browser(headless=headless)
+            _browser_key = headless
+
+        return _browser
+
+
+async def shutdown_browser() -> None:
+    """Stop the shared browser, if one is running on the current loop."""
+    if _browser_loop is not asyncio.get_running_loop():
+        return
+
+    async with _browser_lock:
+        await _stop_browser()
+
+
+async def _stop_browser() -> None:
+    """Stop and forget the shared browser. Caller must hold the lock."""
+    global _browser, _browser_key
+
+    if _browser is not None:
+        try:
+            await _browser.stop()
+        except Exception:
+            pass
+    _browser = None
+    _browser_key = None
+
+
+async def _close_page(page) -> None:
+    """Close a tab opened on the shared browser."""
+    try:
+        await page.close()
+    except Exception:
+        pass
+
+
+async def _open_tab(
+    browser: zd.Browser,
+    url: str,
+    block_resources: bool = False,
+    timeout: float = 30,
+):
+    """
+    Open url in a new tab of browser.
+
+    With block_resources, the tab starts on about:blank so BLOCKED_URL_PATTERNS
+    can be installed before the real navigation begins, and the navigation
+    is given up after timeout seconds. Either way this returns once
+    navigation has started; callers wait for the document.
+    """
+    if not block_resources:
+        return await browser.get(url, new_tab=True)
+
+    page = await browser.get("about:blank", new_tab=True)
+    try:
+        await page.send(cdp.network.enable())
+        await page.send(cdp.network.set_blocked_ur_ls(urls=BLOCKED_URL_PATTERNS))
+        # Page.navigate directly: Tab.get would also wait for network idle.
+        # It only answers once the server responds, so bound it ourselves.
+        try:
+            await asyncio.wait_for(page.send(cdp.page.navigate(url)), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Navigation to {url} timed out after {timeout}s") from None
+    except BaseException:
+        await _close_page(page)
+        raise
+    return page
+
+
+async def _wait_for(page, condition: str, timeout: float) -> bool:
+    """
+    Poll a JavaScript condition until it is truthy or timeout expires.
+
+    The polling interval starts at POLL_INTERVAL_MIN and doubles up to
+    POLL_INTERVAL_MAX, so fast pages return almost immediately.
+
+    Returns:
+        True if the condition was met, False on timeout.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    interval = POLL_INTERVAL_MIN
+
+    while True:
+        try:
+            if await page.evaluate(condition):
+                return True
+        except Exception:
+            # The document may be mid-navigation; try again
+            pass
+
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(interval, remaining))
+        interval = min(interval * 2, POLL_INTERVAL_MAX)
+
+
+def _to_markdown(html: str) -> str:
+    """Extract the main content of a page and convert it to markdown."""
+    return html_to_markdown(extract_main_element(html))
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """Return the background loop used by the sync wrappers, starting it if needed."""
+    global _sync_loop
+
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="zendriver-loop", daemon=True).start()
+            _sync_loop = loop
+        return _sync_loop
+
+
+def _run_sync(coro, timeout: Optional[float] = None):
+    """
+    Run coro on the background loop and block until it finishes.
+
+    If it is still running after timeout seconds it is cancelled and
+    concurrent.futures.TimeoutError is raised.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _get_sync_loop())
+    try:
+        return future.result(timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
+
+
+def prewarm_browser(headless: bool = True) -> None:
+    """
+    Start the sync wrappers' browser in the background without waiting.
+
+    Chromium then starts up while the caller carries on with other work,
+    and the first sync call with the same headless setting finds it
+    running. Pass the headless setting that call will use, and only
+    prewarm when it will need the browser: fetches try plain HTTP first.
+    A failed prewarm is discarded; the next call starts the browser itself.
+
+    Args:
+        headless: Run in headless mode (no visible window).
+    """
+    future = asyncio.run_coroutine_threadsafe(get_browser(headless=headless), _get_sync_loop())
+    future.add_done_callback(_discard_prewarm_error)
+
+
+def _discard_prewarm_error(future) -> None:
+    """Retrieve a finished prewarm's exception so it is never reported."""
+    if not future.cancelled():
+        future.exception()
+
+
+def close_browser() -> None:
+    """Stop the browser used by the synchronous wrappers, if one is running."""
+    if _sync_loop is None:
+        return
+
+    try:
+        _run_sync(shutdown_browser(), timeout=BROWSER_STOP_TIMEOUT)
+    except Exception:
+        pass
+
+
+def _is_challenge(html: str) -> bool:
+    """Return True if html is a bot-challenge interstitial rather than the page."""
+    title = _TITLE_RE.search(html)
+    if title and _CHALLENGE_TITLE_RE.search(title.group(1)):
+        return True
+    head = _HEAD_RE.search(html)
+    return bool(head and _CHALLENGE_HEAD_RE.search(head.group(1)))
+
+
+async def _fetch_over_http(url: str, timeout: float) -> Optional[dict]:
+    """
+    Try to fetch a static page with a plain HTTP GET, without the browser.
+
+    Like Chrome, an http:// URL is tried over https:// first and only
+    fetched as given if that fails, so final_url matches the browser path.
+
+    Returns:
+        Dict with final_url, title and content, or None when the page needs
+        the browser: an error or non-HTML response, a bot challenge, or too
+        little content once converted (such as a JavaScript-rendered shell).
+    """
+    candidates = [url]
+    if url.startswith("http://"):
+        candidates.insert(0, "https://" + url[len("http://"):])
+
+    response = None
+    async with httpx.AsyncClient(
+        follow_redirects=True,
+        timeout=timeout,
+        headers={"User-Agent": HTTP_USER_AGENT},
+    ) as client:
+        for candidate in candidates:
+            try:
+                response = await client.get(candidate)
+                break
+            except Exception:
+                continue
+    if response is None:
+        return None
+
+    if response.status_code != 200 or "html" not in response.headers.get("content-type", ""):
+        return None
+
+    if len(response.content) < HTTP_MIN_HTML_BYTES:
+        return None
+    html = response.text
+    if _is_challenge(html):
+        return None
+
+    markdown = await asyncio.to_thread(_to_markdown, html)
+    if len(markdown) < HTTP_MIN_CONTENT_CHARS:
+        return None
+
+    title = _TITLE_RE.search(html)
+    return {
+        "final_url": str(response.url),
+        "title": unescape(title.group(1)).strip() if title else "",
+        "content": markdown,
+    }
+
+
+@_ttl_cache("url", "headless", "timeout", "wait", "http_first", "block_resources")
 async def fetch_page(
     url: str,
     headless: bool = True,
     timeout: int = 30,
     wait: float = 2.0,
+    block_resources: bool = True,
+    http_first: bool = True,
 ) -> dict:
     """
     Fetch a URL using Zendriver.
 
+    Static pages are first tried over plain HTTP (when httpx is installed),
+    and the browser is only started if that fails or looks incomplete.
+    Successful results are cached per URL and fetch options; pass
+    cache=False to refetch.
+
     Args:
         url: URL to fetch.
         headless: Run in headless mode.
         timeout: Page load timeout in seconds.
-        wait: Seconds to wait for JavaScript to render.
+        wait: Maximum seconds to wait for the DOM to be ready.
+        block_resources: Skip images, fonts, media and stylesheets.
+        http_first: Try a plain HTTP GET before the browser.
 
     Returns:
         Dictionary with page content and metadata.
     """
-    import time
-    from .converter import extract_main_content, html_to_markdown
-
     result = {
         "success": False,
         "url": url,
@@ -58,49 +610,60 @@ async def fetch_page(
         "error": None,
     }
 
-    start_time = time.time()
-    browser = None
+    start_time = time.perf_counter_ns()
+    page = None
 
     try:
-        browser = await create_browser(headless=headless, timeout=timeout)
-        page = await browser.get(url)
+        if http_first and HAS_HTTPX:
+            fast = await _fetch_over_http(url, min(timeout, HTTP_TIMEOUT_SECONDS))
+            if fast is not None:
+                result.update(fast)
+                result["success"] = True
+                result["metadata"] = {
+                    "fetch_time_ms": (time.perf_counter_ns() - start_time) // 1_000_000,
+                    "content_length": len(fast["content"]),
+                    "backend": "zendriver",
+                    "transport": "http",
+                }
+                return result
 
-        # Wait for page to render
-        await asyncio.sleep(wait)
+        browser = await get_browser(headless=headless)
+        page = await _open_tab(browser, url, block_resources, timeout)
 
-        # Get page info
-        result["final_url"] = page.url
-        result["title"] = await page.evaluate("document.title")
+        # Wait for DOMContentLoaded, up to `wait` seconds; the content is in
+        # the DOM by then and slow subresources don't hold up the fetch
+        await _wait_for(page, "document.readyState !== 'loading'", timeout=wait)
 
-        # Get HTML content
-        html = await page.evaluate("document.documentElement.outerHTML")
+        # Get page info and the main content HTML in one round-trip
+        data = await page.evaluate(_EXTRACT_JS)
+        result["final_url"] = data["url"]
+        result["title"] = data["title"]
+        html = data["html"]
 
-        # Convert to markdown
-        main_content = extract_main_content(html)
-        markdown = html_to_markdown(main_content)
+        # Convert to markdown off the event loop so other tabs keep running
+        markdown = await asyncio.to_thread(_to_markdown, html)
 
         result["content"] = markdown
         result["success"] = True
         result["metadata"] = {
-            "fetch_time_ms": int((time.time() - start_time) * 1000),
+            "fetch_time_ms": (time.perf_counter_ns() - start_time) // 1_000_000,
             "content_length": len(markdown),
             "backend": "zendriver",
+            "transport": "browser",
         }
 
     except Exception as e:
         result["error"] = f"{type(e).__name__}: {str(e)}"
-        result["metadata"]["fetch_time_ms"] = int((time.time() - start_time) * 1000)
+        result["metadata"]["fetch_time_ms"] = (time.perf_counter_ns() - start_time) // 1_000_000
 
     finally:
-        if browser:
-            try:
-                await browser.stop()
-            except Exception:
-                pass
+        if page:
+            await _close_page(page)
 
     return result
 
 
+@_ttl_cache("query", "max_results", "headless", "timeout", ttl=SEARCH_CACHE_TTL_SECONDS)
 async def search_google(
     query: str,
     max_results: int = 10,
@@ -110,6 +673,9 @@ async def search_google(
     """
     Perform a Google search using Zendriver.
 
+    Successful results are cached per query and options for
+    SEARCH_CACHE_TTL_SECONDS; pass cache=False to search again.
+
     Args:
         query: Search query.
         max_results: Maximum number of results to return.
@@ -119,9 +685,6 @@ async def search_google(
     Returns:
         Dictionary with search results.
     """
-    import time
-    from urllib.parse import quote_plus
-
     result = {
         "success": False,
         "query": query,
@@ -131,61 +694,28 @@ async def search_google(
         "error": None,
     }
 
-    start_time = time.time()
-    browser = None
+    start_time = time.perf_counter_ns()
+    page = None
     search_url = f"https://www.google.com/search?q={quote_plus(query)}"
 
     try:
-        browser = await create_browser(headless=headless, timeout=timeout)
-        page = await browser.get(search_url)
+        browser = await get_browser(headless=headless)
+        page = await browser.get(search_url, new_tab=True)
 
         # Wait for results to load
-        await asyncio.sleep(2)
+        await _wait_for(page, "document.getElementsByTagName('h3').length > 0",
+                        timeout=min(timeout, RESULTS_WAIT_SECONDS))
 
         # Parse results using JavaScript
-        results = await page.evaluate("""
-            (() => {
-                const results = [];
-                const h3s = document.querySelectorAll('h3');
-
-                for (const h3 of h3s) {
-                    const title = h3.textContent?.trim();
-                    if (!title) continue;
-
-                    // Find parent link
-                    let link = h3.closest('a');
-                    if (!link) {
-                        link = h3.parentElement?.querySelector('a');
-                    }
-                    if (!link) continue;
-
-                    const url = link.href;
-                    if (!url || url.includes('google.com')) continue;
-
-                    // Find snippet
-                    let snippet = '';
-                    const container = h3.closest('div[data-hveid]') || h3.closest('.g');
-                    if (container) {
-                        const snippetEl = container.querySelector('div[data-sncf], div.VwiC3b, span.aCOpRe');
-                        if (snippetEl) {
-                            snippet = snippetEl.textContent?.trim() || '';
-                        }
-                    }
-
-                    results.push({ title, url, snippet });
-                }
-
-                return results;
-            })()
-        """)
+        results = await page.evaluate(_results_js(_GOOGLE_RESULTS_JS, max_results))
 
-        # Ensure results is a list
+        # The script already applied max_results; just guard the type
         if not isinstance(results, list):
             results = []
-        result["results"] = results[:max_results]
+        result["results"] = results
         result["success"] = len(results) > 0
         result["metadata"] = {
-            "search_time_ms": int((time.time() - start_time) * 1000),
+            "search_time_ms": (time.perf_counter_ns() - start_time) // 1_000_000,
             "result_count": len(result["results"]),
             "backend": "zendriver",
         }
@@ -195,18 +725,16 @@ async def search_google(
 
     except Exception as e:
         result["error"] = f"{type(e).__name__}: {str(e)}"
-        result["metadata"]["search_time_ms"] = int((time.time() - start_time) * 1000)
+        result["metadata"]["search_time_ms"] = (time.perf_counter_ns() - start_time) // 1_000_000
 
     finally:
-        if browser:
-            try:
-                await browser.stop()
-            except Exception:
-                pass
+        if page:
+            await _close_page(page)
 
     return result
 
 
+@_ttl_cache("query", "max_results", "headless", "timeout", ttl=SEARCH_CACHE_TTL_SECONDS)
 async def search_bing(
     query: str,
     max_results: int = 10,
@@ -216,6 +744,9 @@ async def search_bing(
     """
     Perform a Bing search using Zendriver.
 
+    Successful results are cached per query and options for
+    SEARCH_CACHE_TTL_SECONDS; pass cache=False to search again.
+
     Args:
         query: Search query.
         max_results: Maximum number of results to return.
@@ -225,9 +756,6 @@ async def search_bing(
     Returns:
         Dictionary with search results.
     """
-    import time
-    from urllib.parse import quote_plus
-
     result = {
         "success": False,
         "query": query,
@@ -237,52 +765,28 @@ async def search_bing(
         "error": None,
     }
 
-    start_time = time.time()
-    browser = None
+    start_time = time.perf_counter_ns()
+    page = None
     search_url = f"https://www.bing.com/search?q={quote_plus(query)}"
 
     try:
-        browser = await create_browser(headless=headless, timeout=timeout)
-        page = await browser.get(search_url)
+        browser = await get_browser(headless=headless)
+        page = await browser.get(search_url, new_tab=True)
 
         # Wait for results to load
-        await asyncio.sleep(2)
+        await _wait_for(page, "document.getElementsByClassName('b_algo').length > 0",
+                        timeout=min(timeout, RESULTS_WAIT_SECONDS))
 
         # Parse results using JavaScript
-        results = await page.evaluate("""
-            (() => {
-                const results = [];
-                const items = document.querySelectorAll('li.b_algo');
-
-                for (const item of items) {
-                    const titleEl = item.querySelector('h2 a');
-                    if (!titleEl) continue;
-
-                    const title = titleEl.textContent?.trim();
-                    const url = titleEl.href;
-
-                    if (!title || !url) continue;
+        results = await page.evaluate(_results_js(_BING_RESULTS_JS, max_results))
 
-                    let snippet = '';
-                    const snippetEl = item.querySelector('p');
-                    if (snippetEl) {
-                        snippet = snippetEl.textContent?.trim() || '';
-                    }
-
-                    results.push({ title, url, snippet });
-                }
-
-                return results;
-            })()
-        """)
-
-        # Ensure results is a list
+        # The script already applied max_results; just guard the type
         if not isinstance(results, list):
             results = []
-        result["results"] = results[:max_results]
+        result["results"] = results
         result["success"] = len(results) > 0
         result["metadata"] = {
-            "search_time_ms": int((time.time() - start_time) * 1000),
+            "search_time_ms": (time.perf_counter_ns() - start_time) // 1_000_000,
             "result_count": len(result["results"]),
             "backend": "zendriver",
         }
@@ -292,29 +796,142 @@ async def search_bing(
 
     except Exception as e:
         result["error"] = f"{type(e).__name__}: {str(e)}"
-        result["metadata"]["search_time_ms"] = int((time.time() - start_time) * 1000)
+        result["metadata"]["search_time_ms"] = (time.perf_counter_ns() - start_time) // 1_000_000
 
     finally:
-        if browser:
-            try:
-                await browser.stop()
-            except Exception:
-                pass
+        if page:
+            await _close_page(page)
 
     return result
 
 
-# Synchronous wrappers for CLI usage
-def fetch_page_sync(url: str, headless: bool = True, timeout: int = 30, wait: float = 2.0) -> dict:
+async def fetch_pages(
+    urls: list[str],
+    headless: bool = True,
+    timeout: int = 30,
+    wait: float = 2.0,
+    concurrency: int = 4,
+) -> list[dict]:
+    """
+    Fetch several URLs concurrently, each in its own tab of the shared browser.
+
+    Args:
+        urls: URLs to fetch.
+        headless: Run in headless mode.
+        timeout: Page load timeout in seconds.
+        wait: Seconds to wait for JavaScript to render.
+        concurrency: Maximum number of tabs open at once.
+
+    Returns:
+        List of fetch_page results, in the same order as urls.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_one(url: str) -> dict:
+        async with semaphore:
+            return await fetch_page(url, headless, timeout, wait)
+
+    return list(await asyncio.gather(*(fetch_one(url) for url in urls)))
+
+
+async def search_many(
+    queries: list[str],
+    engine: str = "bing",
+    max_results: int = 10,
+    headless: bool = True,
+    timeout: int = 30,
+    concurrency: int = 4,
+) -> list[dict]:
+    """
+    Run several searches concurrently, each in its own tab of the shared browser.
+
+    Args:
+        queries: Search queries.
+        engine: Search engine ("google" or "bing").
+        max_results: Maximum number of results per query.
+        headless: Run in headless mode.
+        timeout: Page load timeout in seconds.
+        concurrency: Maximum number of tabs open at once.
+
+    Returns:
+        List of search results, in the same order as queries.
+    """
+    if engine == "google":
+        search = search_google
+    elif engine == "bing":
+        search = search_bing
+    else:
+        raise ValueError(f"Unknown engine: {engine}. Use: ['google', 'bing']")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def search_one(query: str) -> dict:
+        async with semaphore:
+            return await search(query, max_results, headless, timeout)
+
+    return list(await asyncio.gather(*(search_one(query) for query in queries)))
+
+
+# Synchronous wrappers for CLI usage. They share one background event loop,
+# and with it one browser, which is stopped at interpreter exit.
+def fetch_page_sync(
+    url: str,
+    headless: bool = True,
+    timeout: int = 30,
+    wait: float = 2.0,
+    block_resources: bool = True,
+    http_first: bool = True,
+) -> dict:
     """Synchronous wrapper for fetch_page."""
-    return asyncio.run(fetch_page(url, headless, timeout, wait))
+    limit = timeout + wait + SYNC_FETCH_MARGIN
+    try:
+        return _run_sync(
+            fetch_page(url, headless, timeout, wait, block_resources, http_first),
+            timeout=limit,
+        )
+    except concurrent.futures.TimeoutError:
+        return {
+            "success": False,
+            "url": url,
+            "final_url": None,
+            "title": None,
+            "content": None,
+            "metadata": {},
+            "error": f"TimeoutError: fetch did not finish within {limit:g}s",
+        }
 
 
 def search_google_sync(query: str, max_results: int = 10, headless: bool = True, timeout: int = 30) -> dict:
     """Synchronous wrapper for search_google."""
-    return asyncio.run(search_google(query, max_results, headless, timeout))
+    return _run_sync(search_google(query, max_results, headless, timeout))
 
 
 def search_bing_sync(query: str, max_results: int = 10, headless: bool = True, timeout: int = 30) -> dict:
     """Synchronous wrapper for search_bing."""
-    return asyncio.run(search_bing(query, max_results, headless, timeout))
+    return _run_sync(search_bing(query, max_results, headless, timeout))
+
+
+def fetch_pages_sync(
+    urls: list[str],
+    headless: bool = True,
+    timeout: int = 30,
+    wait: float = 2.0,
+    concurrency: int = 4,
+) -> list[dict]:
+    """Synchronous wrapper for fetch_pages."""
+    return _run_sync(fetch_pages(urls, headless, timeout, wait, concurrency))
+
+
+def search_many_sync(
+    queries: list[str],
+    engine: str = "bing",
+    max_results: int = 10,
+    headless: bool = True,
+    timeout: int = 30,
+    concurrency: int = 4,
+) -> list[dict]:
+    """Synchronous wrapper for search_many."""
+    return _run_sync(search_many(queries, engine, max_results, headless, timeout, concurrency))
+
+
+atexit.register(close_browser)
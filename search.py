@@ -10,6 +10,7 @@ Zendriver backend has 75% anti-bot success rate vs 25% for Selenium.
 """
 
 import argparse
+import importlib
 import json
 import sys
 
@@ -20,9 +21,30 @@ BACKENDS = ["selenium", "zendriver"]
 ENGINES = ["google", "bing", "duckduckgo"]
 
 
+def _backend(name: str):
+    """
+    Import `lib.<name>_backend` on first use and cache it in globals.
+
+    Backends are loaded lazily so the CLI only pays for the one it runs
+    (importing zendriver alone adds about half a second to start-up).
+    """
+    attr = f"{name}_backend"
+    module = globals().get(attr)
+    if module is None:
+        module = importlib.import_module(f"lib.{attr}")
+        globals()[attr] = module
+    return module
+
+
+def __getattr__(name: str):
+    if name in ("selenium_backend", "zendriver_backend"):
+        return _backend(name[: -len("_backend")])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def search_with_selenium(query: str, engine: str, max_results: int, headless: bool, timeout: int) -> dict:
     """Run search using selenium backend."""
-    from lib import selenium_backend
+    selenium_backend = _backend("selenium")
 
     if engine == "google":
         return selenium_backend.search_google(query, max_results, headless, timeout)
@@ -36,7 +58,7 @@ def search_with_selenium(query: str, engine: str, max_results: int, headless: bo
 
 def search_with_zendriver(query: str, engine: str, max_results: int, headless: bool, timeout: int) -> dict:
     """Run search using zendriver backend."""
-    from lib import zendriver_backend
+    zendriver_backend = _backend("zendriver")
 
     if engine == "google":
         return zendriver_backend.search_google_sync(query, max_results, headless, timeout)
@@ -47,7 +69,8 @@ def search_with_zendriver(query: str, engine: str, max_results: int, headless: b
         return search_with_selenium(query, engine, max_results, headless, timeout)
 
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(description="Web search via browser automation")
     parser.add_argument("--query", required=True, help="Search query")
     parser.add_argument("--backend", choices=BACKENDS, default="zendriver",
@@ -57,8 +80,11 @@ def main():
     parser.add_argument("--max-results", type=int, default=10, help="Max results")
     parser.add_argument("--headless", action="store_true", help="Run headless")
     parser.add_argument("--timeout", type=int, default=30, help="Timeout seconds")
+    return parser
 
-    args = parser.parse_args()
+
+def main():
+    args = build_parser().parse_args()
 
     if args.backend == "zendriver":
         result = search_with_zendriver(
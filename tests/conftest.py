@@ -1,7 +1,30 @@
 """Pytest configuration and fixtures."""
 
+import sys
+from pathlib import Path
+
 import pytest
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture(autouse=True)
+def reset_driver_pool():
+    """Don't let a shared (possibly mocked) WebDriver leak between tests."""
+    yield
+    from lib import pool
+    pool.close_driver()
+
+
+@pytest.fixture(autouse=True)
+def reset_zendriver_state():
+    """Don't let cached zendriver results or the sync-loop browser leak between tests."""
+    yield
+    zendriver_backend = sys.modules.get("lib.zendriver_backend")
+    if zendriver_backend is not None:
+        zendriver_backend.clear_cache()
+        zendriver_backend.close_browser()
+
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -10,9 +33,25 @@ def pytest_addoption(parser):
         default=False,
         help="Run integration tests (requires Chrome)",
     )
+    parser.addoption(
+        "--no-script-cache",
+        action="store_true",
+        default=False,
+        help="Rerun identical integration script calls instead of reusing their output",
+    )
 
 
+@pytest.hookimpl(tryfirst=True)
 def pytest_collection_modifyitems(config, items):
+    if config.pluginmanager.hasplugin("xdist"):
+        # With --dist=loadgroup, keep each backend's tests on one worker so
+        # it only ever warms up one kind of browser (tryfirst: xdist reads
+        # the group markers in its own collection hook)
+        for item in items:
+            backend = getattr(item, "callspec", None) and item.callspec.params.get("backend")
+            if backend:
+                item.add_marker(pytest.mark.xdist_group(name=backend))
+
     if config.getoption("--run-integration"):
         # Run all tests including integration
         return
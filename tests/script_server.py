@@ -0,0 +1,98 @@
+"""Long-lived runner for fetch.py/search.py used by the integration tests.
+
+Reads one JSON request per line on stdin:
+
+    {"script": "search.py", "args": ["--query", "test", "--headless"]}
+
+runs that script's main() in this process, and writes one JSON line back:
+
+    {"output": {...}, "stdout": "", "stderr": "...", "returncode": 0}
+
+"output" is the script's JSON output, embedded as an object so the client
+decodes it once, with the rest of the line. If the output isn't valid JSON,
+"output" is null and the start of the raw text is in "stdout". Raw stdout
+and stderr are cut to RAW_OUTPUT_LIMIT characters, which is all the tests
+report.
+
+Keeping one interpreter alive skips the Python start-up and imports per
+test, and lets the shared Selenium driver and Zendriver browser be reused
+from one script run to the next.
+"""
+
+import contextlib
+import importlib
+import io
+import json
+import os
+import sys
+from pathlib import Path
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+SKILL_DIR = Path(__file__).parent.parent
+SCRIPTS = {"fetch.py": "fetch", "search.py": "search"}
+RAW_OUTPUT_LIMIT = 500
+
+sys.path.insert(0, str(SKILL_DIR))
+
+
+def run(script: str, args: list[str]) -> dict:
+    """Run a script's main() with args, capturing its output and exit code."""
+    module = importlib.import_module(SCRIPTS[script])
+
+    # Every run should reach the network, as a fresh process would
+    zendriver_backend = sys.modules.get("lib.zendriver_backend")
+    if zendriver_backend is not None:
+        zendriver_backend.clear_cache()
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    sys.argv = [script] + args
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            module.main()
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}", file=sys.stderr)
+            returncode = 1
+
+    text = stdout.getvalue()
+    try:
+        output = orjson.loads(text) if HAS_ORJSON else json.loads(text)
+        text = ""
+    except json.JSONDecodeError:
+        output = None
+
+    return {
+        "output": output,
+        "stdout": text[:RAW_OUTPUT_LIMIT],
+        "stderr": stderr.getvalue()[:RAW_OUTPUT_LIMIT],
+        "returncode": returncode,
+    }
+
+
+def main():
+    # Keep the real stdout for responses; Chrome and chromedriver inherit
+    # fds 1 and 2 and must not write into the protocol stream
+    responses = os.fdopen(os.dup(1), "wb")
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        response = run(request["script"], request["args"])
+        if HAS_ORJSON:
+            responses.write(orjson.dumps(response) + b"\n")
+        else:
+            responses.write(json.dumps(response).encode() + b"\n")
+        responses.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,9 @@ from unittest.mock import Mock, patch, AsyncMock
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# What the in-page result parsers return for one search hit
+RESULTS = [{"title": "Result", "url": "https://example.com", "snippet": "Text"}]
+
 
 class TestSeleniumBackendFunctions:
     """Tests for selenium_backend module functions."""
@@ -22,6 +25,7 @@ class TestSeleniumBackendFunctions:
             mock_driver.current_url = "https://example.com"
             mock_driver.title = "Test Page"
             mock_driver.page_source = "<html><body><main><p>Content</p></main></body></html>"
+            mock_driver.execute_script.return_value = "complete"
             mock_create.return_value = mock_driver
 
             result = selenium_backend.fetch_page(
@@ -60,7 +64,7 @@ class TestSeleniumBackendFunctions:
 
         with patch.object(selenium_backend, 'create_driver') as mock_create:
             mock_driver = Mock()
-            mock_driver.find_elements.return_value = []
+            mock_driver.execute_script.return_value = RESULTS
             mock_create.return_value = mock_driver
 
             result = selenium_backend.search_google(
@@ -73,8 +77,7 @@ class TestSeleniumBackendFunctions:
             assert "query" in result
             assert "engine" in result
             assert result["engine"] == "google"
-            assert "results" in result
-            assert isinstance(result["results"], list)
+            assert result["results"] == RESULTS
             assert "metadata" in result
 
     def test_search_bing_returns_expected_structure(self):
@@ -83,7 +86,7 @@ class TestSeleniumBackendFunctions:
 
         with patch.object(selenium_backend, 'create_driver') as mock_create:
             mock_driver = Mock()
-            mock_driver.find_elements.return_value = []
+            mock_driver.execute_script.return_value = RESULTS
             mock_create.return_value = mock_driver
 
             result = selenium_backend.search_bing(
@@ -96,8 +99,7 @@ class TestSeleniumBackendFunctions:
             assert "query" in result
             assert "engine" in result
             assert result["engine"] == "bing"
-            assert "results" in result
-            assert isinstance(result["results"], list)
+            assert result["results"] == RESULTS
 
     def test_search_duckduckgo_returns_expected_structure(self):
         """Test that search_duckduckgo returns dict with expected keys."""
@@ -105,7 +107,7 @@ class TestSeleniumBackendFunctions:
 
         with patch.object(selenium_backend, 'create_driver') as mock_create:
             mock_driver = Mock()
-            mock_driver.find_elements.return_value = []
+            mock_driver.execute_script.return_value = RESULTS
             mock_create.return_value = mock_driver
 
             result = selenium_backend.search_duckduckgo(
@@ -118,7 +120,267 @@ class TestSeleniumBackendFunctions:
             assert "query" in result
             assert "engine" in result
             assert result["engine"] == "duckduckgo"
-            assert "results" in result
+            assert result["results"] == RESULTS
+
+    def test_search_results_come_from_one_script_call(self):
+        """Test that search results are collected by a single execute_script."""
+        from lib import selenium_backend
+
+        with patch.object(selenium_backend, 'create_driver') as mock_create:
+            mock_driver = Mock()
+            mock_driver.execute_script.return_value = [
+                {"title": "Result", "url": "https://example.com", "snippet": "Text"},
+            ]
+            mock_create.return_value = mock_driver
+
+            result = selenium_backend.search_bing("test", max_results=5, headless=True)
+
+            assert result["success"] is True
+            assert result["results"][0]["url"] == "https://example.com"
+            mock_driver.execute_script.assert_called_once_with(
+                selenium_backend._BING_RESULTS_JS, 5
+            )
+
+
+class TestDriverPool:
+    """Tests for the shared Selenium WebDriver."""
+
+    def test_driver_is_reused_across_calls(self):
+        """Test that consecutive calls start Chrome only once."""
+        from lib import selenium_backend
+
+        with patch.object(selenium_backend, 'create_driver') as mock_create:
+            mock_driver = Mock()
+            mock_driver.execute_script.return_value = RESULTS
+            mock_create.return_value = mock_driver
+
+            first = selenium_backend.search_bing("first", headless=True)
+            second = selenium_backend.search_bing("second", headless=True)
+
+            assert first["results"] == RESULTS
+            assert second["results"] == RESULTS
+            assert mock_create.call_count == 1
+            mock_driver.quit.assert_not_called()
+            mock_driver.get.assert_called_with("about:blank")
+
+    def test_driver_replaced_when_settings_change(self):
+        """Test that different settings quit the old driver."""
+        from lib import selenium_backend
+
+        with patch.object(selenium_backend, 'create_driver') as mock_create:
+            first, second = Mock(), Mock()
+            first.execute_script.return_value = RESULTS
+            second.execute_script.return_value = RESULTS
+            mock_create.side_effect = [first, second]
+
+            headless = selenium_backend.search_bing("test", headless=True)
+            headful = selenium_backend.search_bing("test", headless=False)
+
+            assert headless["results"] == RESULTS
+            assert headful["results"] == RESULTS
+            assert mock_create.call_count == 2
+            first.quit.assert_called_once()
+
+    def test_driver_discarded_after_error(self):
+        """Test that a driver which raised is not handed out again."""
+        from lib import selenium_backend
+
+        with patch.object(selenium_backend, 'create_driver') as mock_create:
+            mock_driver = Mock()
+            mock_driver.get.side_effect = Exception("Page crashed")
+            mock_create.return_value = mock_driver
+
+            result = selenium_backend.fetch_page("https://example.com", headless=True)
+
+            assert result["success"] is False
+            mock_driver.quit.assert_called_once()
+
+    def test_caller_driver_is_not_quit(self):
+        """Test that an explicitly passed driver is left open."""
+        from lib import selenium_backend
+
+        with patch.object(selenium_backend, 'create_driver') as mock_create:
+            mock_driver = Mock()
+            mock_driver.current_url = "https://example.com"
+            mock_driver.title = "Test"
+            mock_driver.page_source = "<html><body>Test</body></html>"
+
+            result = selenium_backend.fetch_page(
+                "https://example.com", wait=0, driver=mock_driver
+            )
+
+            assert result["success"] is True
+            mock_create.assert_not_called()
+            mock_driver.quit.assert_not_called()
+
+    def test_timeout_change_keeps_driver(self):
+        """Test that a new page load timeout is applied without relaunching."""
+        from lib import selenium_backend
+
+        with patch.object(selenium_backend, 'create_driver') as mock_create:
+            mock_driver = Mock()
+            mock_driver.execute_script.return_value = RESULTS
+            mock_create.return_value = mock_driver
+
+            selenium_backend.search_bing("test", headless=True, timeout=30)
+            selenium_backend.search_bing("test", headless=True, timeout=3)
+
+            assert mock_create.call_count == 1
+            mock_driver.quit.assert_not_called()
+            mock_driver.set_page_load_timeout.assert_called_once_with(3)
+
+    def test_nested_borrow_fails_fast(self):
+        """Test that borrowing again on the same thread raises instead of deadlocking."""
+        from lib import pool
+
+        with pool.borrow_driver(factory=Mock()):
+            with pytest.raises(RuntimeError, match="already borrowed"):
+                with pool.borrow_driver(factory=Mock()):
+                    pass
+
+    def test_fetches_block_resources_and_searches_do_not(self):
+        """Test that the pool keys drivers on resource blocking."""
+        from lib import selenium_backend
+
+        with patch.object(selenium_backend, 'create_driver') as mock_create:
+            first, second = Mock(), Mock()
+            first.page_source = "<html><body>Test</body></html>"
+            second.execute_script.return_value = []
+            mock_create.side_effect = [first, second]
+
+            selenium_backend.fetch_page("https://example.com", headless=True, wait=0)
+            selenium_backend.search_bing("test", headless=True)
+
+            assert mock_create.call_args_list[0].kwargs["block_resources"] is True
+            assert mock_create.call_args_list[1].kwargs["block_resources"] is False
+            first.quit.assert_called_once()
+
+    def test_blocking_is_applied_over_cdp(self):
+        """Test that blocked URL patterns are installed on the new driver."""
+        from lib import driver
+
+        with patch.object(driver, '_chromedriver_path', return_value=None), \
+                patch.object(driver.webdriver, 'Chrome') as mock_chrome:
+            driver.create_driver(headless=True, use_undetected=False)
+
+        mock_chrome.return_value.execute_cdp_cmd.assert_any_call(
+            "Network.setBlockedURLs", {"urls": driver.BLOCKED_URL_PATTERNS}
+        )
+
+
+class TestSeleniumPageWait:
+    """Tests for the adaptive page wait in selenium_backend."""
+
+    def test_returns_once_dom_is_stable(self):
+        """Test that a settled page does not wait the full budget."""
+        from lib import selenium_backend
+
+        mock_driver = Mock()
+        mock_driver.execute_script.side_effect = ["complete", 120, 120]
+
+        with patch.object(selenium_backend.time, 'sleep') as mock_sleep:
+            selenium_backend._wait_for_page(mock_driver, wait=10)
+
+        assert mock_sleep.call_count == 1
+        assert mock_driver.execute_script.call_count == 3
+
+    def test_wait_caps_growing_dom(self):
+        """Test that a DOM that keeps changing stops at the wait budget."""
+        from lib import selenium_backend
+
+        mock_driver = Mock()
+        counts = iter(range(1000))
+        mock_driver.execute_script.side_effect = (
+            lambda script: "complete" if "readyState" in script else next(counts)
+        )
+
+        start = selenium_backend.time.time()
+        selenium_backend._wait_for_page(mock_driver, wait=0.5)
+
+        assert selenium_backend.time.time() - start < 2
+
+    def test_wait_caps_document_still_loading(self):
+        """Test that a document stuck loading stops at the wait budget."""
+        from lib import selenium_backend
+
+        mock_driver = Mock()
+        mock_driver.execute_script.return_value = "loading"
+
+        start = selenium_backend.time.time()
+        selenium_backend._wait_for_page(mock_driver, wait=0.5)
+
+        assert selenium_backend.time.time() - start < 2
+
+    def test_navigation_mid_poll_ends_wait(self):
+        """Test that a WebDriver error while polling stops settling quietly."""
+        from lib import selenium_backend
+        from selenium.common.exceptions import WebDriverException
+
+        mock_driver = Mock()
+        mock_driver.execute_script.side_effect = [
+            "interactive", 120, WebDriverException("target frame detached"),
+        ]
+
+        with patch.object(selenium_backend.time, 'sleep'):
+            selenium_backend._wait_for_page(mock_driver, wait=10)
+
+        assert mock_driver.execute_script.call_count == 3
+
+    def test_fetch_returns_before_load_event(self):
+        """Test that fetch_page returns at DOMContentLoaded, not at load."""
+        from lib import selenium_backend
+
+        # Parsed but still loading subresources: readyState never gets to complete
+        mock_driver = Mock()
+        mock_driver.current_url = "https://example.com/"
+        mock_driver.title = "Test"
+        mock_driver.page_source = "<html><body><main><p>Content</p></main></body></html>"
+        mock_driver.execute_script.side_effect = (
+            lambda script: "interactive" if "readyState" in script else 120
+        )
+
+        start = selenium_backend.time.monotonic()
+        result = selenium_backend.fetch_page(
+            "https://example.com", timeout=30, wait=5, driver=mock_driver
+        )
+
+        assert result["success"] is True
+        assert selenium_backend.time.monotonic() - start < 2
+
+    def test_drivers_use_eager_page_load_strategy(self):
+        """Test that driver.get() is set to return at DOMContentLoaded."""
+        from lib import driver
+
+        with patch.object(driver, '_chromedriver_path', return_value=None), \
+                patch.object(driver.webdriver, 'Chrome') as mock_chrome:
+            driver.create_driver(headless=True, use_undetected=False)
+
+        assert mock_chrome.call_args.kwargs["options"].page_load_strategy == "eager"
+
+
+class TestSeleniumSelectorWait:
+    """Tests for the in-page selector wait in selenium_backend."""
+
+    def test_waits_with_single_async_script(self):
+        """Test that the selector wait is one execute_async_script call."""
+        from lib import selenium_backend
+
+        mock_driver = Mock()
+        mock_driver.execute_async_script.return_value = True
+
+        assert selenium_backend._wait_for_selector(mock_driver, "h3", timeout=5) is True
+        mock_driver.execute_async_script.assert_called_once_with(
+            selenium_backend._WAIT_FOR_SELECTOR_JS, "h3", 5000
+        )
+
+    def test_script_error_means_not_found(self):
+        """Test that a failing script is reported as not found."""
+        from lib import selenium_backend
+
+        mock_driver = Mock()
+        mock_driver.execute_async_script.side_effect = Exception("script timeout")
+
+        assert selenium_backend._wait_for_selector(mock_driver, "h3") is False
 
 
 class TestZendriverBackendFunctions:
@@ -204,6 +466,631 @@ class TestZendriverBackendFunctions:
             assert result["engine"] == "bing"
 
 
+class TestZendriverBrowserReuse:
+    """Tests for the shared zendriver browser."""
+
+    @pytest.fixture(autouse=True)
+    def no_http_fast_path(self):
+        """Keep fetches on the mocked browser instead of the network."""
+        from lib import zendriver_backend
+
+        with patch.object(zendriver_backend, 'HAS_HTTPX', False):
+            yield
+
+    @staticmethod
+    def _mock_browser():
+        page = Mock()
+        page.evaluate = AsyncMock(return_value={
+            "title": "Test",
+            "url": "https://example.com/",
+            "html": "<html><body><p>Test</p></body></html>",
+        })
+        page.close = AsyncMock()
+        page.send = AsyncMock()
+        page.get = AsyncMock(return_value=page)
+
+        browser = Mock()
+        browser.stopped = False
+        browser.get = AsyncMock(return_value=page)
+        browser.stop = AsyncMock()
+        return browser, page
+
+    def test_browser_shared_within_event_loop(self):
+        """Test that calls on one loop start one browser and close only tabs."""
+        import asyncio
+        from lib import zendriver_backend
+
+        browser, page = self._mock_browser()
+
+        async def run():
+            await zendriver_backend.fetch_page("https://example.com", wait=0)
+            await zendriver_backend.fetch_page("https://example.org", wait=0)
+            assert browser.stop.await_count == 0
+            await zendriver_backend.shutdown_browser()
+
+        with patch.object(zendriver_backend, 'create_browser', new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = browser
+            asyncio.run(run())
+
+            assert mock_create.await_count == 1
+            assert page.close.await_count == 2
+            browser.stop.assert_awaited_once()
+
+    def test_sync_wrappers_share_browser(self):
+        """Test that sync calls reuse one browser until close_browser."""
+        from lib import zendriver_backend
+
+        browser, page = self._mock_browser()
+
+        with patch.object(zendriver_backend, 'create_browser', new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = browser
+            result = zendriver_backend.fetch_page_sync("https://example.com", wait=0)
+            zendriver_backend.fetch_page_sync("https://example.org", wait=0)
+
+            assert result["success"] is True
+            assert result["final_url"] == "https://example.com/"
+            assert result["title"] == "Test"
+            assert mock_create.await_count == 1
+            assert browser.stop.await_count == 0
+
+            zendriver_backend.close_browser()
+            browser.stop.assert_awaited_once()
+
+    def test_prewarmed_browser_is_used_by_sync_calls(self):
+        """Test that prewarm_browser starts the browser the sync wrappers reuse."""
+        from lib import zendriver_backend
+
+        browser, page = self._mock_browser()
+
+        with patch.object(zendriver_backend, 'create_browser', new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = browser
+            zendriver_backend.prewarm_browser()
+            result = zendriver_backend.fetch_page_sync("https://example.com", wait=0)
+
+            assert result["success"] is True
+            mock_create.assert_awaited_once_with(headless=True)
+
+    def test_prewarm_uses_callers_headless_setting(self):
+        """Test that a headful prewarm is reused by a headful call."""
+        from lib import zendriver_backend
+
+        browser, page = self._mock_browser()
+
+        with patch.object(zendriver_backend, 'create_browser', new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = browser
+            zendriver_backend.prewarm_browser(headless=False)
+            zendriver_backend.fetch_page_sync("https://example.com", headless=False, wait=0)
+
+            mock_create.assert_awaited_once_with(headless=False)
+            browser.stop.assert_not_awaited()
+
+    def test_failed_prewarm_is_retried_by_next_call(self):
+        """Test that a prewarm error is discarded and the next call starts Chrome."""
+        from lib import zendriver_backend
+
+        browser, page = self._mock_browser()
+
+        with patch.object(zendriver_backend, 'create_browser', new_callable=AsyncMock) as mock_create:
+            mock_create.side_effect = [RuntimeError("no browser"), browser]
+            zendriver_backend.prewarm_browser()
+            result = zendriver_backend.fetch_page_sync("https://example.com", wait=0)
+
+            assert result["success"] is True
+            assert mock_create.await_count == 2
+
+    def test_fetch_blocks_resources_before_navigating(self):
+        """Test that blocked URL patterns are installed before the page loads."""
+        import asyncio
+        from lib import zendriver_backend
+
+        browser, page = self._mock_browser()
+
+        with patch.object(zendriver_backend, 'get_browser', new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = browser
+            result = asyncio.run(zendriver_backend.fetch_page("https://example.com", wait=0))
+
+        assert result["success"] is True
+        browser.get.assert_awaited_once_with("about:blank", new_tab=True)
+        assert page.send.await_count == 3
+        page.get.assert_not_awaited()
+
+    def test_fetch_reads_only_main_content_from_page(self):
+        """Test that the main element is picked in the page, not the whole DOM."""
+        import asyncio
+        from lib import zendriver_backend
+        from lib.converter import MAIN_SELECTORS
+
+        browser, page = self._mock_browser()
+
+        with patch.object(zendriver_backend, 'get_browser', new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = browser
+            result = asyncio.run(zendriver_backend.fetch_page("https://example.com", wait=0))
+
+        assert result["content"] == "Test"
+        page.evaluate.assert_awaited_with(zendriver_backend._EXTRACT_JS)
+        assert all(selector in zendriver_backend._EXTRACT_JS for selector in MAIN_SELECTORS)
+
+    def test_fetch_without_blocking_navigates_directly(self):
+        """Test that block_resources=False opens the URL straight away."""
+        import asyncio
+        from lib import zendriver_backend
+
+        browser, page = self._mock_browser()
+
+        with patch.object(zendriver_backend, 'get_browser', new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = browser
+            result = asyncio.run(zendriver_backend.fetch_page(
+                "https://example.com", wait=0, block_resources=False
+            ))
+
+        assert result["success"] is True
+        browser.get.assert_awaited_once_with("https://example.com", new_tab=True)
+        page.send.assert_not_awaited()
+
+    def test_block_resources_settings_are_cached_separately(self):
+        """Test that a blocked render is not served to a call without blocking."""
+        import asyncio
+        from lib import zendriver_backend
+
+        browser, page = self._mock_browser()
+
+        async def run():
+            await zendriver_backend.fetch_page("https://example.com", wait=0)
+            return await zendriver_backend.fetch_page(
+                "https://example.com", wait=0, block_resources=False
+            )
+
+        with patch.object(zendriver_backend, 'get_browser', new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = browser
+            result = asyncio.run(run())
+
+        assert "cached" not in result["metadata"]
+        assert browser.get.await_args_list[-1].args == ("https://example.com",)
+        assert page.close.await_count == 2
+
+    def test_unanswered_navigation_times_out(self):
+        """Test that a server that never responds fails the fetch at timeout."""
+        import asyncio
+        from lib import zendriver_backend
+
+        browser, page = self._mock_browser()
+        sent = []
+
+        async def send(command):
+            sent.append(command)
+            if len(sent) == 3:
+                await asyncio.Event().wait()
+
+        page.send = AsyncMock(side_effect=send)
+
+        with patch.object(zendriver_backend, 'get_browser', new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = browser
+            result = asyncio.run(zendriver_backend.fetch_page("https://example.com", timeout=0.2))
+
+        assert result["success"] is False
+        assert result["error"].startswith("TimeoutError: Navigation to https://example.com")
+        page.close.assert_awaited_once()
+
+    def test_sync_fetch_gives_up_after_its_limit(self):
+        """Test that fetch_page_sync returns a failure instead of blocking forever."""
+        import asyncio
+        from lib import zendriver_backend
+
+        async def hang(**kwargs):
+            await asyncio.Event().wait()
+
+        with patch.object(zendriver_backend, 'create_browser', side_effect=hang), \
+                patch.object(zendriver_backend, 'SYNC_FETCH_MARGIN', 0.2):
+            result = zendriver_backend.fetch_page_sync("https://example.com", timeout=0, wait=0)
+
+        assert result["success"] is False
+        assert result["error"].startswith("TimeoutError")
+
+    def test_blocked_patterns_cover_query_strings(self):
+        """Test that versioned asset URLs are blocked too."""
+        from lib import zendriver_backend
+
+        assert "*.css?*" in zendriver_backend.BLOCKED_URL_PATTERNS
+        assert "*.woff2?*" in zendriver_backend.BLOCKED_URL_PATTERNS
+
+
+class TestZendriverHttpFastPath:
+    """Tests for the plain HTTP fast path in zendriver fetch_page."""
+
+    def test_static_page_skips_browser(self):
+        """Test that a usable HTTP response is returned without the browser."""
+        import asyncio
+        from lib import zendriver_backend
+
+        fast = {"final_url": "https://example.com/", "title": "Test", "content": "# Test"}
+
+        with patch.object(zendriver_backend, 'HAS_HTTPX', True), \
+                patch.object(zendriver_backend, '_fetch_over_http', new_callable=AsyncMock) as mock_http, \
+                patch.object(zendriver_backend, 'get_browser', new_callable=AsyncMock) as mock_get:
+            mock_http.return_value = fast
+            result = asyncio.run(zendriver_backend.fetch_page("https://example.com"))
+
+        assert result["success"] is True
+        assert result["content"] == "# Test"
+        assert result["metadata"]["transport"] == "http"
+        mock_get.assert_not_awaited()
+
+    def test_unusable_response_falls_back_to_browser(self):
+        """Test that the browser is used when the HTTP fast path declines."""
+        import asyncio
+        from lib import zendriver_backend
+
+        with patch.object(zendriver_backend, 'HAS_HTTPX', True), \
+                patch.object(zendriver_backend, '_fetch_over_http', new_callable=AsyncMock) as mock_http, \
+                patch.object(zendriver_backend, 'get_browser', new_callable=AsyncMock) as mock_get:
+            mock_http.return_value = None
+            mock_get.side_effect = RuntimeError("no browser")
+            result = asyncio.run(zendriver_backend.fetch_page("https://example.com"))
+
+        assert result["success"] is False
+        mock_get.assert_awaited_once()
+
+    def test_http_result_not_served_to_browser_only_call(self):
+        """Test that http_first=False does not reuse a cached HTTP result."""
+        import asyncio
+        from lib import zendriver_backend
+
+        fast = {"final_url": "https://example.com/", "title": "Test", "content": "# Test"}
+
+        async def run():
+            await zendriver_backend.fetch_page("https://example.com")
+            return await zendriver_backend.fetch_page("https://example.com", http_first=False)
+
+        with patch.object(zendriver_backend, 'HAS_HTTPX', True), \
+                patch.object(zendriver_backend, '_fetch_over_http', new_callable=AsyncMock) as mock_http, \
+                patch.object(zendriver_backend, 'get_browser', new_callable=AsyncMock) as mock_get:
+            mock_http.return_value = fast
+            mock_get.side_effect = RuntimeError("no browser")
+            result = asyncio.run(run())
+
+        assert result["success"] is False
+        mock_http.assert_awaited_once()
+        mock_get.assert_awaited_once()
+
+    def test_http_response_checks(self):
+        """Test which HTTP responses the fast path accepts."""
+        import asyncio
+        import functools
+        httpx = pytest.importorskip("httpx")
+        from lib import zendriver_backend
+
+        article = "<p>" + "Plenty of static article text. " * 50 + "</p>"
+        pages = {
+            "/static": (200, f"<html><head><title>A &amp; B</title></head><body><main>{article}</main></body></html>"),
+            "/challenge": (200, f"<html><head><title>Just a moment...</title></head><body>{article}</body></html>"),
+            "/shell": (200, "<html><body><div id='root'></div>" + "<script></script>" * 100 + "</body></html>"),
+            "/forbidden": (403, f"<html><body>{article}</body></html>"),
+            "/cf-head": (200, "<html><head><script src='/cdn-cgi/challenge-platform/h/b/orchestrate/chl_page/v1'>"
+                              f"</script></head><body>{article}</body></html>"),
+            "/blog": (200, "<html><head><title>Blog</title></head><body>"
+                           "<noscript>Please enable JavaScript to view the comments.</noscript>"
+                           f"<main>{article}</main>"
+                           "<script src='https://www.google.com/recaptcha/api.js'></script></body></html>"),
+        }
+
+        def handler(request):
+            status, body = pages[request.url.path]
+            return httpx.Response(status, text=body, headers={"content-type": "text/html"})
+
+        client = functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler))
+
+        async def fetch(path):
+            return await zendriver_backend._fetch_over_http(f"https://example.com{path}", timeout=5)
+
+        with patch.object(zendriver_backend.httpx, 'AsyncClient', client):
+            static = asyncio.run(fetch("/static"))
+            assert static["title"] == "A & B"
+            assert "Plenty of static article text." in static["content"]
+            assert asyncio.run(fetch("/blog"))["title"] == "Blog"
+            for path in ("/challenge", "/cf-head", "/shell", "/forbidden"):
+                assert asyncio.run(fetch(path)) is None
+
+    def test_http_url_is_upgraded_like_the_browser(self):
+        """Test that http:// is fetched over https:// first, as Chrome does."""
+        import asyncio
+        import functools
+        httpx = pytest.importorskip("httpx")
+        from lib import zendriver_backend
+
+        article = "<html><body><main><p>" + "Plenty of static article text. " * 50 + "</p></main></body></html>"
+        https_up = True
+
+        def handler(request):
+            if request.url.scheme == "https" and not https_up:
+                raise httpx.ConnectError("connection refused", request=request)
+            return httpx.Response(200, text=article, headers={"content-type": "text/html"})
+
+        client = functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler))
+
+        async def fetch():
+            return await zendriver_backend._fetch_over_http("http://example.com/", timeout=5)
+
+        with patch.object(zendriver_backend.httpx, 'AsyncClient', client):
+            assert asyncio.run(fetch())["final_url"] == "https://example.com/"
+            https_up = False
+            assert asyncio.run(fetch())["final_url"] == "http://example.com/"
+
+
+class TestZendriverSearchParsing:
+    """Tests for the in-page result parsing in zendriver searches."""
+
+    def test_max_results_is_passed_to_script(self):
+        """Test that the result cap is applied inside the page script."""
+        from lib import zendriver_backend
+
+        page = Mock()
+        page.evaluate = AsyncMock(side_effect=[
+            True,
+            [{"title": "Result", "url": "https://example.com", "snippet": "Text"}],
+        ])
+        page.close = AsyncMock()
+        browser = Mock()
+        browser.get = AsyncMock(return_value=page)
+
+        with patch.object(zendriver_backend, 'get_browser', new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = browser
+            result = zendriver_backend.search_bing_sync("test", max_results=3)
+
+        assert result["success"] is True
+        page.evaluate.assert_awaited_with(
+            zendriver_backend._results_js(zendriver_backend._BING_RESULTS_JS, 3)
+        )
+        assert page.evaluate.await_args.args[0].endswith("(3)")
+
+
+class TestZendriverResultCache:
+    """Tests for the in-process zendriver result cache."""
+
+    @staticmethod
+    def _cached_fetch(success=True):
+        """Return a cached fake fetch and a Mock counting real calls."""
+        import asyncio
+        from lib import zendriver_backend
+
+        calls = Mock()
+
+        async def fake_fetch(url, headless=True):
+            calls(url)
+            await asyncio.sleep(0.01)
+            return {"success": success, "url": url, "content": "# Test", "metadata": {}}
+
+        return zendriver_backend._ttl_cache("url")(fake_fetch), calls
+
+    def test_repeat_call_is_served_from_cache(self):
+        """Test that a repeated call skips the fetch and is marked cached."""
+        import asyncio
+
+        fetch, calls = self._cached_fetch()
+
+        async def run():
+            first = await fetch("https://example.com")
+            first["content"] = "changed by caller"
+            return await fetch("https://example.com", headless=False)
+
+        second = asyncio.run(run())
+
+        assert calls.call_count == 1
+        assert second["content"] == "# Test"
+        assert second["metadata"]["cached"] is True
+
+    def test_concurrent_calls_share_one_fetch(self):
+        """Test that simultaneous calls for one key run the fetch once."""
+        import asyncio
+
+        fetch, calls = self._cached_fetch()
+
+        async def run():
+            return await asyncio.gather(*(fetch("https://example.com") for _ in range(3)))
+
+        results = asyncio.run(run())
+
+        assert calls.call_count == 1
+        assert all(r["success"] for r in results)
+
+    def test_failed_results_are_not_cached(self):
+        """Test that a failed fetch is retried on the next call."""
+        import asyncio
+
+        fetch, calls = self._cached_fetch(success=False)
+
+        asyncio.run(fetch("https://example.com"))
+        asyncio.run(fetch("https://example.com"))
+
+        assert calls.call_count == 2
+
+    def test_cache_false_bypasses_cache(self):
+        """Test that cache=False always runs the fetch."""
+        import asyncio
+
+        fetch, calls = self._cached_fetch()
+
+        asyncio.run(fetch("https://example.com"))
+        asyncio.run(fetch("https://example.com", cache=False))
+
+        assert calls.call_count == 2
+
+    def test_entries_expire(self):
+        """Test that entries older than the TTL are refetched."""
+        import asyncio
+        from lib import zendriver_backend
+
+        fetch, calls = self._cached_fetch()
+
+        with patch.object(zendriver_backend, 'CACHE_TTL_SECONDS', 0):
+            asyncio.run(fetch("https://example.com"))
+            asyncio.run(fetch("https://example.com"))
+
+        assert calls.call_count == 2
+
+    def test_per_function_ttl(self):
+        """Test that an explicit ttl overrides CACHE_TTL_SECONDS."""
+        import asyncio
+        from lib import zendriver_backend
+
+        calls = Mock()
+
+        async def fake_search(query):
+            calls(query)
+            return {"success": True, "query": query, "metadata": {}}
+
+        search = zendriver_backend._ttl_cache("query", ttl=0)(fake_search)
+        asyncio.run(search("test"))
+        asyncio.run(search("test"))
+
+        assert calls.call_count == 2
+        assert zendriver_backend.SEARCH_CACHE_TTL_SECONDS < zendriver_backend.CACHE_TTL_SECONDS
+
+    def test_late_caller_waits_for_running_fetch(self):
+        """Test that a caller arriving while a waiter runs the fetch still waits."""
+        import asyncio
+        from lib import zendriver_backend
+
+        running = []
+        overlap = []
+
+        async def fake_fetch(url):
+            overlap.append(len(running))
+            running.append(url)
+            await asyncio.sleep(0.02)
+            running.remove(url)
+            return {"success": False, "url": url, "metadata": {}}
+
+        fetch = zendriver_backend._ttl_cache("url")(fake_fetch)
+
+        async def late():
+            await asyncio.sleep(0.03)
+            return await fetch("https://example.com")
+
+        async def run():
+            await asyncio.gather(fetch("https://example.com"), fetch("https://example.com"), late())
+
+        asyncio.run(run())
+
+        assert overlap == [0, 0, 0]
+
+    def test_same_key_from_two_event_loops(self):
+        """Test that the sync loop and a caller's loop can both wait on one key."""
+        import asyncio
+        import threading
+        from lib import zendriver_backend
+
+        fetch, calls = self._cached_fetch(success=False)
+        errors = []
+
+        async def fetch_twice():
+            await asyncio.gather(*(fetch("https://example.com") for _ in range(2)))
+
+        def run():
+            try:
+                asyncio.run(fetch_twice())
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert calls.call_count == 4
+
+    def test_fetch_options_are_part_of_the_key(self):
+        """Test that fetches with different options don't share an entry."""
+        import asyncio
+        from lib import zendriver_backend
+
+        fast = {"final_url": "https://example.com/", "title": "Test", "content": "# Test"}
+
+        async def run():
+            await zendriver_backend.fetch_page("https://example.com")
+            await zendriver_backend.fetch_page("https://example.com", headless=False)
+            await zendriver_backend.fetch_page("https://example.com", timeout=10)
+            await zendriver_backend.fetch_page("https://example.com", wait=5)
+
+        with patch.object(zendriver_backend, 'HAS_HTTPX', True), \
+                patch.object(zendriver_backend, '_fetch_over_http', new_callable=AsyncMock) as mock_http:
+            mock_http.return_value = fast
+            asyncio.run(run())
+
+        assert mock_http.await_count == 4
+
+
+class TestZendriverWaitFor:
+    """Tests for the condition-driven wait in zendriver_backend."""
+
+    def test_returns_as_soon_as_condition_holds(self):
+        """Test that a met condition returns without sleeping the timeout."""
+        import asyncio
+        from lib import zendriver_backend
+
+        page = Mock()
+        page.evaluate = AsyncMock(side_effect=[False, False, True])
+
+        met = asyncio.run(zendriver_backend._wait_for(page, "cond", timeout=5))
+
+        assert met is True
+        assert page.evaluate.await_count == 3
+
+    def test_times_out(self):
+        """Test that an unmet condition gives up at the timeout."""
+        import asyncio
+        import time
+        from lib import zendriver_backend
+
+        page = Mock()
+        page.evaluate = AsyncMock(return_value=False)
+
+        start = time.monotonic()
+        met = asyncio.run(zendriver_backend._wait_for(page, "cond", timeout=0.3))
+
+        assert met is False
+        assert time.monotonic() - start < 1
+
+
+class TestZendriverBatch:
+    """Tests for zendriver batch helpers."""
+
+    def test_fetch_pages_sync_returns_list_in_order(self):
+        """Test that fetch_pages_sync returns one result per URL, in order."""
+        from lib import zendriver_backend
+
+        async def fake_fetch(url, headless, timeout, wait):
+            return {"success": True, "url": url}
+
+        urls = ["https://a.example", "https://b.example", "https://c.example"]
+        with patch.object(zendriver_backend, 'fetch_page', side_effect=fake_fetch):
+            results = zendriver_backend.fetch_pages_sync(urls, concurrency=2)
+
+        assert isinstance(results, list)
+        assert [r["url"] for r in results] == urls
+
+    def test_search_many_sync_uses_engine(self):
+        """Test that search_many_sync dispatches to the requested engine."""
+        from lib import zendriver_backend
+
+        async def fake_search(query, max_results, headless, timeout):
+            return {"success": True, "query": query, "engine": "google"}
+
+        with patch.object(zendriver_backend, 'search_google', side_effect=fake_search):
+            results = zendriver_backend.search_many_sync(["a", "b"], engine="google")
+
+        assert [r["query"] for r in results] == ["a", "b"]
+        assert all(r["engine"] == "google" for r in results)
+
+    def test_search_many_rejects_unknown_engine(self):
+        """Test that unsupported engines raise ValueError."""
+        from lib import zendriver_backend
+
+        with pytest.raises(ValueError):
+            zendriver_backend.search_many_sync(["a"], engine="duckduckgo")
+
+
 class TestBackendSelection:
     """Tests for backend selection in main scripts."""
 
@@ -231,6 +1118,24 @@ class TestBackendSelection:
         assert hasattr(zendriver_backend, 'search_google_sync')
         assert hasattr(zendriver_backend, 'search_bing_sync')
 
+    def test_fetch_prewarm_flag(self, capsys):
+        """Test that fetch.py --prewarm starts the browser before fetching."""
+        import fetch
+        from lib import zendriver_backend
+
+        calls = Mock()
+        result = {"success": True, "content": "# Test"}
+
+        with patch.object(zendriver_backend, 'prewarm_browser', calls.prewarm), \
+                patch.object(zendriver_backend, 'fetch_page_sync', calls.fetch), \
+                patch.object(sys, 'argv', ["fetch.py", "--url", "https://example.com", "--prewarm"]):
+            calls.fetch.return_value = result
+            with pytest.raises(SystemExit):
+                fetch.main()
+
+        assert [c[0] for c in calls.mock_calls] == ["prewarm", "fetch"]
+        calls.prewarm.assert_called_once_with(headless=False)
+
 
 class TestMetadataBackendField:
     """Test that metadata includes backend identifier."""
@@ -244,6 +1149,7 @@ class TestMetadataBackendField:
             mock_driver.current_url = "https://example.com"
             mock_driver.title = "Test"
             mock_driver.page_source = "<html><body>Test</body></html>"
+            mock_driver.execute_script.return_value = "complete"
             mock_create.return_value = mock_driver
 
             result = selenium_backend.fetch_page("https://example.com", headless=True)
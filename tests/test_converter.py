@@ -7,7 +7,13 @@ from pathlib import Path
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from lib.converter import extract_main_content, html_to_markdown, truncate_content
+from lib import converter
+from lib.converter import (
+    extract_main_content,
+    extract_main_element,
+    html_to_markdown,
+    truncate_content,
+)
 
 
 class TestExtractMainContent:
@@ -82,6 +88,51 @@ class TestExtractMainContent:
         # Nav/sidebar should be removed
         assert "Nav stuff" not in result
 
+    def test_bs4_fallback_matches_selectolax(self):
+        pytest.importorskip("selectolax")
+        html = """
+        <html>
+            <body>
+                <div id="cookie-banner">Accept cookies</div>
+                <div class="content">
+                    <h1>Title</h1>
+                    <aside>Aside</aside>
+                    <p>Body text.</p>
+                </div>
+            </body>
+        </html>
+        """
+        fast = html_to_markdown(converter._extract_main_content_lexbor(html))
+        slow = html_to_markdown(converter._extract_main_element_bs4(html))
+        assert fast == slow
+        assert "Body text" in fast
+        assert "Accept cookies" not in fast
+        assert "Aside" not in fast
+
+    def test_removes_comments(self):
+        html = "<html><body><main><!-- tracking --><p>Content</p></main></body></html>"
+        result = extract_main_content(html)
+        assert "Content" in result
+        assert "tracking" not in result
+
+
+class TestExtractMainElement:
+    """Tests for extract_main_element function."""
+
+    def test_returns_parsed_element(self):
+        html = "<html><body><nav>Nav</nav><main><p>Body text.</p></main></body></html>"
+        result = extract_main_element(html)
+        assert not isinstance(result, str)
+        assert "Body text." in result.get_text()
+        assert "Nav" not in result.get_text()
+
+    def test_markdown_matches_string_path(self):
+        html = '<html><body><article><h1>Title</h1><a href="/x">Link</a></article></body></html>'
+        from_tag = html_to_markdown(extract_main_element(html), base_url="https://example.com")
+        from_str = html_to_markdown(extract_main_content(html), base_url="https://example.com")
+        assert from_tag == from_str
+        assert "https://example.com/x" in from_tag
+
 
 class TestHtmlToMarkdown:
     """Tests for html_to_markdown function."""
@@ -113,6 +164,12 @@ class TestHtmlToMarkdown:
         # Should not have excessive blank lines
         assert "\n\n\n" not in result
 
+    def test_strips_trailing_whitespace(self):
+        html = "<p>Line 1 &nbsp; </p><p>   </p><p>Line 2</p>"
+        result = html_to_markdown(html)
+        assert all(line == line.rstrip() for line in result.split("\n"))
+        assert "\n\n\n" not in result
+
 
 class TestTruncateContent:
     """Tests for truncate_content function."""
@@ -3,6 +3,16 @@
 These tests require Chrome and network access.
 Run with: pytest tests/test_integration.py -v --run-integration
 
+Scripts run in one long-lived tests/script_server.py process per test
+session (per worker under pytest-xdist), so the interpreter, imports and
+browsers are reused between tests. Spread the suite across cores with:
+
+    pytest tests/test_integration.py --run-integration -n auto
+
+or, to keep each backend's tests on its own worker with one warm browser:
+
+    pytest tests/test_integration.py --run-integration -n 2 --dist=loadgroup
+
 NOTE: Search tests may fail due to bot detection (CAPTCHA) when run
 in automated/headless mode. This is expected behavior - the skill is
 designed to work with the user's real browser profile which has
@@ -10,60 +20,201 @@ legitimate cookies and browsing history.
 """
 
 import json
+import os
 import pytest
+import select
+import signal
 import subprocess
 import sys
 from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 SKILL_DIR = Path(__file__).parent.parent
+SCRIPT_SERVER = str(SKILL_DIR / "tests" / "script_server.py")
 BACKENDS = ["selenium", "zendriver"]
 
+# Errors meaning Chrome or its driver isn't installed (matched lowercase).
+# undetected-chromedriver fails with "binary location must be a string"
+# when Chrome is missing, or with a urlopen error when it can't download
+# chromedriver; page loads report net::ERR_* instead, so neither is a
+# fetch failure.
+CHROME_MISSING_MARKERS = (
+    "could not find a valid browser binary",
+    "cannot find chrome binary",
+    "no chrome binary",
+    "unable to obtain driver for chrome",
+    "binary location must be a string",
+    "<urlopen error",
+)
+
+# (query, engine, max_results, backend, checks) for TestSearchScript.test_search;
+# None leaves the option at the script's default. checks names the assertions
+# each case makes on top of the common ones (see test_search), so a case is
+# held only to what it was written to verify.
+SEARCH_CASES = [
+    ("test", "bing", 3, "selenium", {"fields"}),
+    ("test", "bing", 3, "zendriver", {"fields", "engine"}),
+    ("python", None, None, "selenium", {"metadata"}),
+    ("python", None, None, "zendriver", {"metadata"}),
+    ("python", "bing", None, "selenium", {"items"}),
+    ("python", "bing", None, "zendriver", {"items"}),
+    ("python", "bing", 2, "zendriver", {"limit"}),
+    ("test", "google", 3, "zendriver", {"engine"}),
+    ("python programming language", "google", 5, "zendriver", {"backend", "nonempty", "limit"}),
+    ("machine learning tutorial", "bing", 5, "zendriver", {"backend", "nonempty"}),
+    ("weather today", "bing", 3, "zendriver", {"query"}),
+    ("latest news", "bing", 3, "zendriver", {"query"}),
+    ("how to cook pasta", "bing", 3, "zendriver", {"query"}),
+    ("best programming languages 2024", "bing", 3, "zendriver", {"query"}),
+    ("C++ programming", "bing", 3, "zendriver", {"query_kept"}),
+    ('"machine learning"', "bing", 3, "zendriver", set()),
+    ("python documentation", "google", 5, "zendriver", {"urls"}),
+    ("python documentation", "bing", 5, "zendriver", {"urls"}),
+    ("test query", "bing", None, "zendriver", {"timing"}),
+]
+
+
+class ScriptServer:
+    """Client for tests/script_server.py, restarted if it dies or times out."""
+
+    def __init__(self):
+        self.proc: Optional[subprocess.Popen] = None
+
+    def run(self, script_name: str, args: list[str], timeout: int) -> dict:
+        """Run a script in the server and return its output/stdout/stderr/returncode."""
+        if self.proc is None or self.proc.poll() is not None:
+            self.proc = subprocess.Popen(
+                [sys.executable, SCRIPT_SERVER],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+
+        request = json.dumps({"script": script_name, "args": args}) + "\n"
+        self.proc.stdin.write(request.encode())
+        self.proc.stdin.flush()
+
+        ready, _, _ = select.select([self.proc.stdout], [], [], timeout)
+        if not ready:
+            self.kill()
+            raise subprocess.TimeoutExpired([script_name] + args, timeout)
+
+        line = self.proc.stdout.readline()
+        if not line:
+            self.kill()
+            return {"output": None, "stdout": "", "stderr": "script server exited", "returncode": 1}
+        # Responses carry whole pages; orjson decodes the bytes directly
+        return orjson.loads(line) if HAS_ORJSON else json.loads(line)
+
+    def close(self) -> None:
+        """Let the server exit on end of input, so its browsers are shut down."""
+        if self.proc is None:
+            return
+        try:
+            self.proc.communicate(timeout=30)
+        except subprocess.TimeoutExpired:
+            self.kill()
+        self.proc = None
+
+    def kill(self) -> None:
+        """Kill the server and any browsers it started."""
+        if self.proc is None:
+            return
+        try:
+            os.killpg(self.proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        self.proc.wait()
+        self.proc = None
+
+
+_server = ScriptServer()
+
+# Serialized output of earlier identical run_script calls, keyed by
+# (script_name, args); disabled with --no-script-cache
+_script_cache: dict[tuple, bytes] = {}
+_script_cache_enabled = True
+
+
+@pytest.fixture(scope="session", autouse=True)
+def script_server():
+    """Stop the shared script server once the session is over."""
+    yield _server
+    _server.close()
+    _script_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def script_cache_policy(request):
+    """Use the run_script cache unless disabled or the test is flaky.
+
+    A rerun of a flaky test has to run its scripts again rather than get
+    back the output that just failed.
+    """
+    global _script_cache_enabled
 
-def run_script(script_name: str, args: list[str], timeout: int = 60) -> dict:
-    """Run a script and parse JSON output."""
-    script_path = SKILL_DIR / script_name
-    cmd = [sys.executable, str(script_path)] + args
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        timeout=timeout,
+    _script_cache_enabled = (
+        not request.config.getoption("--no-script-cache")
+        and request.node.get_closest_marker("flaky") is None
     )
 
-    try:
-        return json.loads(result.stdout)
-    except json.JSONDecodeError:
-        return {
-            "success": False,
-            "error": f"Failed to parse output: {result.stdout[:500]}",
-            "stderr": result.stderr[:500],
-        }
+
+def chrome_missing_error(result: dict) -> Optional[str]:
+    """Return the error text if a script run failed for lack of Chrome, else None."""
+    error = str((result["output"] or {}).get("error")) + result["stderr"]
+    if any(marker in error.lower() for marker in CHROME_MISSING_MARKERS):
+        return error
+    return None
 
 
-@pytest.fixture
-def check_chrome():
-    """Skip if Chrome is not available."""
-    try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
+def run_script(script_name: str, args: list[str], timeout: int = 60) -> dict:
+    """Run a script and parse JSON output.
+
+    Identical calls within a session reuse the first call's output, so each
+    test still gets its own copy but the network is only hit once.
+    """
+    key = (script_name, tuple(args))
+    if _script_cache_enabled and key in _script_cache:
+        cached = _script_cache[key]
+        return orjson.loads(cached) if HAS_ORJSON else json.loads(cached)
+
+    result = _server.run(script_name, args, timeout)
 
-        options = Options()
-        options.add_argument("--headless=new")
-        options.add_argument("--no-sandbox")
+    # Scripts report a missing browser like any other error; skip, don't fail
+    error = chrome_missing_error(result)
+    if error:
+        pytest.skip(f"Chrome not available: {error[:200]}")
 
-        driver = webdriver.Chrome(options=options)
-        driver.quit()
-    except Exception as e:
-        pytest.skip(f"Chrome not available: {e}")
+    if result["output"] is not None:
+        if _script_cache_enabled:
+            output = result["output"]
+            _script_cache[key] = orjson.dumps(output) if HAS_ORJSON else json.dumps(output).encode()
+        return result["output"]
+    return {
+        "success": False,
+        "error": f"Failed to parse output: {result['stdout']}",
+        "stderr": result["stderr"],
+    }
+
+
+@pytest.fixture(params=BACKENDS, ids=BACKENDS)
+def backend(request):
+    """Run the requesting test once per backend."""
+    return request.param
 
 
 class TestFetchScript:
     """Tests for fetch.py script."""
 
     @pytest.mark.integration
-    @pytest.mark.parametrize("backend", BACKENDS)
-    def test_fetch_simple_url(self, check_chrome, backend):
+    def test_fetch_simple_url(self, backend):
         """Test fetching a simple public URL with each backend."""
         result = run_script("fetch.py", [
             "--url", "https://example.com",
@@ -79,8 +230,7 @@ class TestFetchScript:
         assert result["metadata"]["backend"] == backend
 
     @pytest.mark.integration
-    @pytest.mark.parametrize("backend", BACKENDS)
-    def test_fetch_with_redirect(self, check_chrome, backend):
+    def test_fetch_with_redirect(self, backend):
         """Test fetching a URL that redirects with each backend."""
         result = run_script("fetch.py", [
             "--url", "http://example.com",
@@ -92,13 +242,13 @@ class TestFetchScript:
         assert "https" in result["final_url"]
 
     @pytest.mark.integration
-    @pytest.mark.parametrize("backend", BACKENDS)
-    def test_fetch_invalid_url(self, check_chrome, backend):
+    def test_fetch_invalid_url(self, backend):
         """Test fetching an invalid URL with each backend."""
+        # Nothing listens on port 1, so the connection is refused at once
         result = run_script("fetch.py", [
-            "--url", "https://this-domain-does-not-exist-12345.com",
+            "--url", "http://127.0.0.1:1/",
             "--headless",
-            "--timeout", "10",
+            "--timeout", "3",
             "--backend", backend,
         ])
 
@@ -107,11 +257,11 @@ class TestFetchScript:
             assert result["error"] is not None
         else:
             # Zendriver returns Chrome's error page as content
-            assert "can't be reached" in result["content"] or "DNS" in result["content"]
+            content = result["content"].replace("\u2019", "'")
+            assert "can't be reached" in content or "ERR_CONNECTION_REFUSED" in content
 
     @pytest.mark.integration
-    @pytest.mark.parametrize("backend", BACKENDS)
-    def test_fetch_returns_metadata(self, check_chrome, backend):
+    def test_fetch_returns_metadata(self, backend):
         """Test that fetch returns proper metadata for each backend."""
         result = run_script("fetch.py", [
             "--url", "https://example.com",
@@ -131,76 +281,88 @@ class TestSearchScript:
 
     NOTE: Search engines aggressively block automated/headless access.
     These tests verify the script runs and returns proper JSON structure,
-    but may not return actual results due to bot detection.
+    but may not return actual results due to bot detection. Live searches
+    are marked flaky, so with pytest-rerunfailures installed a transient
+    block reruns just that case.
     """
 
     @pytest.mark.integration
-    @pytest.mark.parametrize("backend", BACKENDS)
-    def test_search_returns_valid_json(self, check_chrome, backend):
-        """Test that search returns valid JSON structure for each backend."""
-        result = run_script("search.py", [
-            "--query", "test",
-            "--engine", "bing",
-            "--max-results", "3",
-            "--headless",
-            "--backend", backend,
-        ], timeout=45)
+    @pytest.mark.flaky(reruns=2, reruns_delay=3)
+    @pytest.mark.parametrize("query,engine,max_results,backend,checks", SEARCH_CASES)
+    def test_search(self, query, engine, max_results, backend, checks):
+        """Test search output for each query/engine/limit/backend case."""
+        args = ["--query", query, "--headless", "--backend", backend]
+        if engine is not None:
+            args += ["--engine", engine]
+        if max_results is not None:
+            args += ["--max-results", str(max_results)]
+
+        result = run_script("search.py", args, timeout=60)
+        results = result.get("results")
 
         # Should always have these fields regardless of success
         assert "success" in result
-        assert "query" in result
-        assert "engine" in result
-        assert "results" in result
-        assert "metadata" in result
-        assert isinstance(result["results"], list)
+        assert isinstance(results, list)
 
-    @pytest.mark.integration
-    @pytest.mark.parametrize("backend", BACKENDS)
-    def test_search_metadata_structure(self, check_chrome, backend):
-        """Test that search metadata has expected fields for each backend."""
-        result = run_script("search.py", [
-            "--query", "python",
-            "--headless",
-            "--backend", backend,
-        ], timeout=45)
+        if "fields" in checks:
+            for field in ("query", "engine", "metadata"):
+                assert field in result
 
-        assert "metadata" in result
-        assert "search_time_ms" in result["metadata"]
-        assert result["metadata"]["search_time_ms"] >= 0
-        assert result["metadata"]["backend"] == backend
+        if "query" in checks:
+            assert result["query"] == query
 
-    @pytest.mark.integration
-    @pytest.mark.parametrize("backend", BACKENDS)
-    def test_search_results_structure_when_successful(self, check_chrome, backend):
-        """Test result structure when search succeeds for each backend."""
-        result = run_script("search.py", [
-            "--query", "python",
-            "--engine", "bing",
-            "--headless",
-            "--backend", backend,
-        ], timeout=45)
+        if "query_kept" in checks:
+            # Special characters survive the round trip
+            assert query.split()[0] in result["query"]
+
+        if "engine" in checks:
+            assert result["engine"] == engine
+
+        if "metadata" in checks:
+            assert result["metadata"]["search_time_ms"] >= 0
+            assert result["metadata"]["backend"] == backend
+
+        if "backend" in checks:
+            assert result["metadata"]["backend"] == backend
+
+        # Result checks only apply if we got some (bot detection may block us)
+        if "nonempty" in checks and result["success"]:
+            assert len(results) > 0
+
+        if "limit" in checks and result["success"]:
+            assert len(results) <= max_results
 
-        # Only validate structure if we got results
-        if result["success"] and len(result["results"]) > 0:
-            first_result = result["results"][0]
-            assert "title" in first_result
-            assert "url" in first_result
-            assert "snippet" in first_result
+        if "items" in checks and result["success"] and results:
+            for key in ("title", "url", "snippet"):
+                assert key in results[0]
+
+        if "urls" in checks and result["success"]:
+            for item in results:
+                assert item["url"].startswith("http")
+                # URL should not be a search engine URL
+                assert "google.com/search" not in item["url"]
+                assert "bing.com/search" not in item["url"]
+
+        if "timing" in checks:
+            # Search should complete in reasonable time (under 30 seconds)
+            assert result["metadata"]["search_time_ms"] < 30000
 
-    @pytest.mark.parametrize("backend", BACKENDS)
     def test_search_invalid_engine(self, backend):
-        """Test with invalid search engine for each backend."""
-        result = run_script("search.py", [
-            "--query", "test",
-            "--engine", "invalid_engine",
-            "--backend", backend,
-        ])
+        """Test argparse rejects an invalid search engine for each backend."""
+        from search import build_parser
 
-        # argparse should reject this - either error in result or stderr
-        assert result.get("success") is False or "error" in str(result)
+        with pytest.raises(SystemExit):
+            build_parser().parse_args([
+                "--query", "test",
+                "--engine", "invalid_engine",
+                "--backend", backend,
+            ])
 
     @pytest.mark.integration
-    def test_search_zendriver_fallback_to_selenium(self, check_chrome):
+    @pytest.mark.flaky(reruns=2, reruns_delay=3)
+    # Not parametrized by backend, but the search runs in Selenium's browser
+    @pytest.mark.xdist_group(name="selenium")
+    def test_search_zendriver_fallback_to_selenium(self):
         """Test zendriver falls back to selenium for duckduckgo."""
         result = run_script("search.py", [
             "--query", "test",
@@ -217,172 +379,28 @@ class TestSearchScript:
         assert result["metadata"]["backend"] == "selenium"
 
 
-class TestZendriverSearches:
-    """Extended tests specifically for zendriver backend searches."""
-
-    @pytest.mark.integration
-    def test_zendriver_google_search(self, check_chrome):
-        """Test zendriver Google search returns results."""
-        result = run_script("search.py", [
-            "--query", "python programming language",
-            "--engine", "google",
-            "--max-results", "5",
-            "--headless",
-            "--backend", "zendriver",
-        ], timeout=60)
-
-        assert "success" in result
-        assert "results" in result
-        assert result["metadata"]["backend"] == "zendriver"
-        # If successful, verify we got results
-        if result["success"]:
-            assert len(result["results"]) > 0
-            assert len(result["results"]) <= 5
-
-    @pytest.mark.integration
-    def test_zendriver_bing_search(self, check_chrome):
-        """Test zendriver Bing search returns results."""
-        result = run_script("search.py", [
-            "--query", "machine learning tutorial",
-            "--engine", "bing",
-            "--max-results", "5",
-            "--headless",
-            "--backend", "zendriver",
-        ], timeout=60)
-
-        assert "success" in result
-        assert "results" in result
-        assert result["metadata"]["backend"] == "zendriver"
-        if result["success"]:
-            assert len(result["results"]) > 0
+class TestChromeMissing:
+    """Tests for recognising a missing browser in script output."""
 
-    @pytest.mark.integration
-    @pytest.mark.parametrize("query", [
-        "weather today",
-        "latest news",
-        "how to cook pasta",
-        "best programming languages 2024",
+    @pytest.mark.parametrize("backend,error", [
+        ("zendriver", "FileNotFoundError: could not find a valid browser binary. "
+                      "please make sure it is installed"),
+        ("selenium", "URLError: <urlopen error [Errno -2] Name or service not known>"),
+        ("selenium", "TypeError: Binary Location Must be a String"),
+        ("selenium", "NoSuchDriverException: Message: Unable to obtain driver for chrome"),
     ])
-    def test_zendriver_various_queries(self, check_chrome, query):
-        """Test zendriver with various search queries."""
-        result = run_script("search.py", [
-            "--query", query,
-            "--engine", "bing",
-            "--max-results", "3",
-            "--headless",
-            "--backend", "zendriver",
-        ], timeout=60)
-
-        assert "success" in result
-        assert "query" in result
-        assert result["query"] == query
-        assert "results" in result
-        assert isinstance(result["results"], list)
-
-    @pytest.mark.integration
-    def test_zendriver_search_max_results_limit(self, check_chrome):
-        """Test that max-results parameter is respected."""
-        result = run_script("search.py", [
-            "--query", "python",
-            "--engine", "bing",
-            "--max-results", "2",
-            "--headless",
-            "--backend", "zendriver",
-        ], timeout=60)
-
-        assert "results" in result
-        if result["success"] and len(result["results"]) > 0:
-            assert len(result["results"]) <= 2
-
-    @pytest.mark.integration
-    def test_zendriver_search_special_characters(self, check_chrome):
-        """Test zendriver handles queries with special characters."""
-        result = run_script("search.py", [
-            "--query", "C++ programming",
-            "--engine", "bing",
-            "--max-results", "3",
-            "--headless",
-            "--backend", "zendriver",
-        ], timeout=60)
-
-        assert "success" in result
-        assert "results" in result
-        # Query should be preserved
-        assert "C++" in result["query"]
-
-    @pytest.mark.integration
-    def test_zendriver_search_quoted_query(self, check_chrome):
-        """Test zendriver handles exact phrase queries."""
-        result = run_script("search.py", [
-            "--query", '"machine learning"',
-            "--engine", "bing",
-            "--max-results", "3",
-            "--headless",
-            "--backend", "zendriver",
-        ], timeout=60)
-
-        assert "success" in result
-        assert "results" in result
-
-    @pytest.mark.integration
-    @pytest.mark.parametrize("engine", ["google", "bing"])
-    def test_zendriver_result_urls_are_valid(self, check_chrome, engine):
-        """Test that search results contain valid URLs."""
-        result = run_script("search.py", [
-            "--query", "python documentation",
-            "--engine", engine,
-            "--max-results", "5",
-            "--headless",
-            "--backend", "zendriver",
-        ], timeout=60)
+    def test_driver_start_errors_skip(self, backend, error):
+        """Test that each backend's driver-start error counts as Chrome missing."""
+        result = {"output": {"success": False, "error": error}, "stderr": "", "returncode": 1}
 
-        if result["success"] and len(result["results"]) > 0:
-            for item in result["results"]:
-                assert "url" in item
-                assert item["url"].startswith("http")
-                # URL should not be a search engine URL
-                assert "google.com/search" not in item["url"]
-                assert "bing.com/search" not in item["url"]
+        assert chrome_missing_error(result) is not None
 
-    @pytest.mark.integration
-    def test_zendriver_search_timing(self, check_chrome):
-        """Test that search timing is recorded."""
-        result = run_script("search.py", [
-            "--query", "test query",
-            "--engine", "bing",
-            "--headless",
-            "--backend", "zendriver",
-        ], timeout=60)
-
-        assert "metadata" in result
-        assert "search_time_ms" in result["metadata"]
-        # Search should complete in reasonable time (under 30 seconds)
-        assert result["metadata"]["search_time_ms"] < 30000
-
-    @pytest.mark.integration
-    def test_zendriver_google_vs_bing_both_work(self, check_chrome):
-        """Test that both Google and Bing work with zendriver."""
-        google_result = run_script("search.py", [
-            "--query", "test",
-            "--engine", "google",
-            "--max-results", "3",
-            "--headless",
-            "--backend", "zendriver",
-        ], timeout=60)
-
-        bing_result = run_script("search.py", [
-            "--query", "test",
-            "--engine", "bing",
-            "--max-results", "3",
-            "--headless",
-            "--backend", "zendriver",
-        ], timeout=60)
+    def test_page_errors_do_not_skip(self):
+        """Test that a page that fails to load is still reported as a failure."""
+        error = "WebDriverException: Message: unknown error: net::ERR_CONNECTION_REFUSED"
+        result = {"output": {"success": False, "error": error}, "stderr": "", "returncode": 1}
 
-        # Both should return valid structure
-        assert "success" in google_result
-        assert "success" in bing_result
-        assert google_result["engine"] == "google"
-        assert bing_result["engine"] == "bing"
+        assert chrome_missing_error(result) is None
 
 
 # Marker for integration tests